@@ -11,6 +11,9 @@ from alembic import op
 import sqlalchemy as sa
 
 ${imports if imports else ""}
+# To add a value to a Postgres enum type, call
+# app.db.migration_helpers.add_enum_value(type_name, value) rather than
+# renaming/recreating the type, which rewrites every table that uses it.
 
 revision = ${repr(up_revision)}
 down_revision = ${repr(down_revision)}
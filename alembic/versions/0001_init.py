@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import sqlalchemy as sa
 from alembic import op
+from app.db.migration_helpers import GENRE_VALUES
 from sqlalchemy.dialects import postgresql
 
 revision = "0001_init"
@@ -41,17 +42,13 @@ def upgrade() -> None:
     op.create_index("ix_persons_email", "persons", ["email"], unique=True)
 
     # Create enum only if it doesn't exist (e.g. after a previous partial run)
+    genre_labels = ", ".join(f"'{value}'" for value in GENRE_VALUES)
     op.execute(
-        """
+        f"""
         DO $$
         BEGIN
             IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'genre') THEN
-                CREATE TYPE genre AS ENUM (
-                    'Action', 'Comedy', 'Drama', 'Horror', 'SciFi', 'Thriller',
-                    'Fantasy', 'Romance', 'Animation', 'Adventure', 'Family',
-                    'Mystery', 'War', 'Western', 'Crime', 'Documentary',
-                    'Biography', 'History'
-                );
+                CREATE TYPE genre AS ENUM ({genre_labels});
             END IF;
         END
         $$;
@@ -59,28 +56,7 @@ def upgrade() -> None:
     )
 
     # Use PostgreSQL ENUM that references existing type (no CREATE TYPE)
-    genre_enum = postgresql.ENUM(
-        "Action",
-        "Comedy",
-        "Drama",
-        "Horror",
-        "SciFi",
-        "Thriller",
-        "Fantasy",
-        "Romance",
-        "Animation",
-        "Adventure",
-        "Family",
-        "Mystery",
-        "War",
-        "Western",
-        "Crime",
-        "Documentary",
-        "Biography",
-        "History",
-        name="genre",
-        create_type=False,
-    )
+    genre_enum = postgresql.ENUM(*GENRE_VALUES, name="genre", create_type=False)
 
     op.create_table(
         "movies",
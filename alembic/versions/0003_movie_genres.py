@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import sqlalchemy as sa
 from alembic import op
+from app.db.migration_helpers import GENRE_VALUES
 from sqlalchemy.dialects import postgresql
 
 revision = "0003_movie_genres"
@@ -17,32 +18,11 @@ down_revision = "0002_movie_persons"
 branch_labels = None
 depends_on = None
 
+GENRE_ENUM = postgresql.ENUM(*GENRE_VALUES, name="genre", create_type=False)
+
 
 def upgrade() -> None:
     # Create movie_genres junction table (genre enum already exists)
-    genre_enum = postgresql.ENUM(
-        "Action",
-        "Comedy",
-        "Drama",
-        "Horror",
-        "SciFi",
-        "Thriller",
-        "Fantasy",
-        "Romance",
-        "Animation",
-        "Adventure",
-        "Family",
-        "Mystery",
-        "War",
-        "Western",
-        "Crime",
-        "Documentary",
-        "Biography",
-        "History",
-        name="genre",
-        create_type=False,
-    )
-
     op.create_table(
         "movie_genres",
         sa.Column(
@@ -51,7 +31,7 @@ def upgrade() -> None:
             sa.ForeignKey("movies.id", ondelete="CASCADE"),
             nullable=False,
         ),
-        sa.Column("genre", genre_enum, nullable=False),
+        sa.Column("genre", GENRE_ENUM, nullable=False),
         sa.PrimaryKeyConstraint("movie_id", "genre", name="pk_movie_genres"),
     )
     op.create_index("ix_movie_genres_movie_id", "movie_genres", ["movie_id"], unique=False)
@@ -71,36 +51,20 @@ def upgrade() -> None:
 
 def downgrade() -> None:
     # Re-add genre column (single); use first genre per movie
-    genre_enum = postgresql.ENUM(
-        "Action",
-        "Comedy",
-        "Drama",
-        "Horror",
-        "SciFi",
-        "Thriller",
-        "Fantasy",
-        "Romance",
-        "Animation",
-        "Adventure",
-        "Family",
-        "Mystery",
-        "War",
-        "Western",
-        "Crime",
-        "Documentary",
-        "Biography",
-        "History",
-        name="genre",
-        create_type=False,
-    )
     op.add_column(
         "movies",
-        sa.Column("genre", genre_enum, nullable=True),
+        sa.Column("genre", GENRE_ENUM, nullable=True),
     )
     op.execute(
         """
         UPDATE movies m
-        SET genre = (SELECT mg.genre FROM movie_genres mg WHERE mg.movie_id = m.id LIMIT 1)
+        SET genre = src.genre
+        FROM (
+            SELECT DISTINCT ON (movie_id) movie_id, genre
+            FROM movie_genres
+            ORDER BY movie_id, genre
+        ) src
+        WHERE m.id = src.movie_id
         """
     )
     op.alter_column("movies", "genre", nullable=False)
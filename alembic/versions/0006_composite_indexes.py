@@ -0,0 +1,33 @@
+"""composite indexes for per-movie lookups
+
+Revision ID: 0006_composite_indexes
+Revises: 0005_add_reviews
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0006_composite_indexes"
+down_revision = "0005_add_reviews"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Cast/crew of a movie by role, and a movie's reviews newest first.
+    op.create_index("ix_movie_persons_movie_role", "movie_persons", ["movie_id", "role"])
+    op.create_index("ix_reviews_movie_created", "reviews", ["movie_id", sa.text("created_at DESC")])
+    # Both are leading-column prefixes of the new indexes.
+    op.drop_index("ix_movie_persons_movie_id", table_name="movie_persons")
+    op.drop_index("ix_reviews_movie_id", table_name="reviews")
+
+
+def downgrade() -> None:
+    op.create_index("ix_reviews_movie_id", "reviews", ["movie_id"])
+    op.create_index("ix_movie_persons_movie_id", "movie_persons", ["movie_id"])
+    op.drop_index("ix_reviews_movie_created", table_name="reviews")
+    op.drop_index("ix_movie_persons_movie_role", table_name="movie_persons")
@@ -0,0 +1,34 @@
+"""covering index for per-movie review aggregates
+
+Revision ID: 0007_covering_indexes
+Revises: 0006_composite_indexes
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0007_covering_indexes"
+down_revision = "0006_composite_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Carrying rating in the leaf pages lets count/avg over a movie's reviews run as an
+    # index-only scan instead of visiting the heap for every review.
+    op.create_index(
+        "ix_reviews_movie_covering",
+        "reviews",
+        ["movie_id", sa.text("created_at DESC")],
+        postgresql_include=["rating"],
+    )
+    op.drop_index("ix_reviews_movie_created", table_name="reviews")
+
+
+def downgrade() -> None:
+    op.create_index("ix_reviews_movie_created", "reviews", ["movie_id", sa.text("created_at DESC")])
+    op.drop_index("ix_reviews_movie_covering", table_name="reviews")
@@ -0,0 +1,24 @@
+"""index movies.release_date for year range search
+
+Revision ID: 0009_movies_release_date_index
+Revises: 0008_reviews_statistics
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0009_movies_release_date_index"
+down_revision = "0008_reviews_statistics"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_movies_release_date", "movies", ["release_date"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_movies_release_date", table_name="movies")
@@ -0,0 +1,29 @@
+"""widen the movie_persons (movie_id, role) index with person_id
+
+Revision ID: 0010_movie_role_person_index
+Revises: 0009_movies_release_date_index
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0010_movie_role_person_index"
+down_revision = "0009_movies_release_date_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Search filters by movie, role and person together; the old index is a prefix.
+    op.create_index(
+        "ix_movie_persons_movie_role_person", "movie_persons", ["movie_id", "role", "person_id"]
+    )
+    op.drop_index("ix_movie_persons_movie_role", table_name="movie_persons")
+
+
+def downgrade() -> None:
+    op.create_index("ix_movie_persons_movie_role", "movie_persons", ["movie_id", "role"])
+    op.drop_index("ix_movie_persons_movie_role_person", table_name="movie_persons")
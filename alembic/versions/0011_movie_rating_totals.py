@@ -0,0 +1,41 @@
+"""running review rating totals on movies
+
+Revision ID: 0011_movie_rating_totals
+Revises: 0010_movie_role_person_index
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0011_movie_rating_totals"
+down_revision = "0010_movie_role_person_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("movies", sa.Column("rating_sum", sa.Float(), nullable=False, server_default="0"))
+    op.add_column(
+        "movies", sa.Column("rating_count", sa.Integer(), nullable=False, server_default="0")
+    )
+    op.execute(
+        """
+        UPDATE movies m
+        SET rating_sum = r.rating_sum, rating_count = r.rating_count
+        FROM (
+            SELECT movie_id, sum(rating) AS rating_sum, count(*) AS rating_count
+            FROM reviews
+            GROUP BY movie_id
+        ) r
+        WHERE r.movie_id = m.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("movies", "rating_count")
+    op.drop_column("movies", "rating_sum")
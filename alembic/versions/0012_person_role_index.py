@@ -0,0 +1,47 @@
+"""index movie_persons by (person_id, role)
+
+Revision ID: 0012_person_role_index
+Revises: 0011_movie_rating_totals
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0012_person_role_index"
+down_revision = "0011_movie_rating_totals"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps movie_persons writable during the build; it cannot run
+    # inside a transaction.
+    with op.get_context().autocommit_block():
+        # Person search by role and a person's credits; the person_id index is its prefix.
+        op.create_index(
+            "ix_movie_persons_person_role",
+            "movie_persons",
+            ["person_id", "role"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_movie_persons_person_id", table_name="movie_persons", postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_movie_persons_person_id",
+            "movie_persons",
+            ["person_id"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_movie_persons_person_role",
+            table_name="movie_persons",
+            postgresql_concurrently=True,
+        )
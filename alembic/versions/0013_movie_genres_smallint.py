@@ -0,0 +1,36 @@
+"""store movie_genres.genre as smallint instead of the genre enum
+
+Revision ID: 0013_movie_genres_smallint
+Revises: 0012_person_role_index
+Create Date: 2026-10-15
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+from app.db.migration_helpers import GENRE_VALUES
+
+revision = "0013_movie_genres_smallint"
+down_revision = "0012_person_role_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Enum labels are declared in Genre value order, so a label's 1-based position in
+    # the type is its value. The rewrite also rebuilds pk_movie_genres and the index.
+    op.execute(
+        "ALTER TABLE movie_genres ALTER COLUMN genre TYPE smallint "
+        "USING array_position(enum_range(NULL::genre), genre)"
+    )
+    op.execute("DROP TYPE genre")
+
+
+def downgrade() -> None:
+    genre_labels = ", ".join(f"'{label}'" for label in GENRE_VALUES)
+    op.execute(f"CREATE TYPE genre AS ENUM ({genre_labels})")
+    op.execute(
+        "ALTER TABLE movie_genres ALTER COLUMN genre TYPE genre "
+        "USING (enum_range(NULL::genre))[genre]"
+    )
@@ -0,0 +1,19 @@
+"""Response helpers shared by the routers."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+from fastapi import Response
+
+
+def json_response(
+    body: str, status_code: int = 200, headers: Mapping[str, str] | None = None
+) -> Response:
+    """
+    Wrap JSON already produced by response models' model_dump_json(). Returning a
+    Response skips FastAPI's re-validation of the returned model against response_model
+    and its generic encoder; the response_model on the route still documents the shape.
+    Cache the string, not the Response: middleware may add headers to a Response.
+    """
+    return Response(body, status_code=status_code, headers=headers, media_type="application/json")
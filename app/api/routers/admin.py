@@ -1,13 +1,22 @@
 """Admin endpoints for database reset and seed."""
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+import logging
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
 
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import response_cache
 from app.db.clean_db import run_clean
 from app.db.models.movies import Movie
 from app.db.models.person import Person
 from app.db.seed import run_seed
-from app.db.session import get_db
+from app.db.session import engine, get_async_db
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -17,13 +26,17 @@ router = APIRouter(prefix="/admin", tags=["admin"])
     summary="Get database statistics",
     description="Returns statistics about the database including total movies and total persons.",
 )
-def get_stats(db: Session = Depends(get_db)) -> dict:
+async def get_stats(db: AsyncSession = Depends(get_async_db)) -> dict:
     """Get database statistics."""
-    total_movies = db.query(Movie).count()
-    total_persons = db.query(Person).count()
+    # Both counts as scalar subqueries of a single SELECT: one round trip.
+    stmt = select(
+        select(func.count()).select_from(Movie).scalar_subquery().label("total_movies"),
+        select(func.count()).select_from(Person).scalar_subquery().label("total_persons"),
+    )
+    row = (await db.execute(stmt)).one()
     return {
-        "total_movies": total_movies,
-        "total_professionals": total_persons,
+        "total_movies": row.total_movies,
+        "total_professionals": row.total_persons,
     }
 
 
@@ -34,32 +47,101 @@ def get_stats(db: Session = Depends(get_db)) -> dict:
 )
 def admin_db_clean() -> dict:
     run_clean()
+    response_cache.clear()
     return {"status": "ok", "message": "Database cleaned (all movies and persons removed)."}
 
 
-@router.post(
-    "/db/seed",
-    summary="Seed database",
-    description="Load data from app/db/data.json. Only inserts if the database has no movies.",
-)
-def admin_db_seed() -> dict:
+def _seed() -> dict:
     seeded = run_seed()
+    response_cache.clear()
     if seeded:
         return {"status": "ok", "message": "Database seeded from data.json."}
     return {"status": "skipped", "message": "Database already has data or data.json missing."}
 
 
-@router.post(
-    "/db/reset",
-    summary="Reset database",
-    description="Clean then seed: truncate all data and load from data.json.",
-)
-def admin_db_reset() -> dict:
-    run_clean()
-    seeded = run_seed()
+def _reset() -> dict:
+    # One connection and one transaction: a failed seed rolls the truncate back too.
+    with engine.begin() as conn:
+        run_clean(bind=conn)
+        seeded = run_seed(bind=conn)
+    response_cache.clear()
     return {
         "status": "ok",
         "message": "Database reset: cleaned and seeded."
         if seeded
         else "Database reset: cleaned (seed skipped).",
     }
+
+
+# Background admin jobs of this process, oldest first; only the latest MAX_JOBS are kept.
+# Other workers cannot see them: polling a job needs a single-worker deployment.
+MAX_JOBS = 100
+_jobs: OrderedDict[str, dict] = OrderedDict()
+
+
+def _start_job(action: str, work: Callable[[], dict], background: BackgroundTasks) -> dict:
+    job = {"id": uuid.uuid4().hex, "action": action, "status": "pending", "result": None}
+    _jobs[job["id"]] = job
+    while len(_jobs) > MAX_JOBS:
+        _jobs.popitem(last=False)
+    background.add_task(_run_job, job, work)
+    return job
+
+
+def _run_job(job: dict, work: Callable[[], dict]) -> None:
+    job["status"] = "running"
+    try:
+        job["result"] = work()
+        job["status"] = "done"
+    except Exception:
+        logger.exception("Admin job %s (%s) failed", job["id"], job["action"])
+        job["status"] = "failed"
+
+
+@router.post(
+    "/db/seed",
+    summary="Seed database",
+    description="Load data from app/db/data.json. Only inserts if the database has no movies. "
+    "With background=true, returns 202 and a job to poll at /admin/db/job/{job_id}.",
+)
+def admin_db_seed(
+    response: Response,
+    background_tasks: BackgroundTasks,
+    background: bool = Query(False, description="Run after responding; returns a job."),
+) -> dict:
+    if background:
+        response.status_code = 202
+        return _start_job("seed", _seed, background_tasks)
+    return _seed()
+
+
+@router.post(
+    "/db/reset",
+    summary="Reset database",
+    description="Clean then seed: truncate all data and load from data.json. "
+    "With background=true, returns 202 and a job to poll at /admin/db/job/{job_id}.",
+)
+def admin_db_reset(
+    response: Response,
+    background_tasks: BackgroundTasks,
+    background: bool = Query(False, description="Run after responding; returns a job."),
+) -> dict:
+    if background:
+        response.status_code = 202
+        return _start_job("reset", _reset, background_tasks)
+    return _reset()
+
+
+@router.get(
+    "/db/job/{job_id}",
+    summary="Get admin job",
+    description="Status of a background seed/reset job: pending, running, done or failed. "
+    "Jobs live in the memory of the process that started them, so this needs a single "
+    "worker: with several, a poll that reaches another worker returns 404.",
+    responses={404: {"description": "Job not found."}},
+)
+def get_admin_job(job_id: str) -> dict:
+    job = _jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
@@ -1,16 +1,39 @@
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
-from sqlalchemy import delete, or_, select
+from datetime import date
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Body,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+)
+from sqlalchemy import Select, and_, delete, lambda_stmt, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager, raiseload, selectinload
 from sqlalchemy.sql import exists, func
 
+from app.api.responses import json_response
+from app.cache import response_cache
 from app.db.models.movie_genre import MovieGenre
 from app.db.models.movie_person import MoviePerson
 from app.db.models.movies import Movie
 from app.db.models.person import Person
 from app.db.models.review import Review
 from app.db.models.role import MovieRole
-from app.db.session import get_db
+from app.db.session import get_async_db
+from app.openapi_examples import (
+    ADD_PERSONS_TO_MOVIE_EXAMPLES,
+    MOVIE_BULK_CREATE_EXAMPLES,
+    MOVIE_CREATE_EXAMPLES,
+    MOVIE_UPDATE_EXAMPLES,
+    REVIEW_CREATE_EXAMPLES,
+)
 from app.schemas.movie import (
     MovieBulkCreate,
     MovieCreate,
@@ -24,24 +47,94 @@ from app.schemas.movie_person import (
     MoviePersonResponse,
     PersonInMovieResponse,
 )
-from app.schemas.review import ReviewCreate, ReviewListResponse, ReviewResponse
+from app.schemas.review import (
+    ReviewCreate,
+    ReviewListResponse,
+    ReviewResponse,
+)
 from app.storage.config import get_storage
 
 router = APIRouter(prefix="/movies", tags=["movies"])
 
+_FOREIGN_KEY_VIOLATION = "23503"  # Postgres SQLSTATE
+
+# MovieResponse reads only the genres. Cast/crew and reviews have their own endpoints,
+# so don't let the models' lazy="selectin" default load them with every movie, and make
+# any other relationship access raise instead of quietly issuing a query per movie.
+_MOVIE_RESPONSE_LOAD = (
+    selectinload(Movie.movie_genre_entries),
+    raiseload("*"),
+)
+
 
-def _get_movie(movie_id: int, db: Session) -> Movie:
-    movie = db.get(Movie, movie_id)
+async def _get_movie(movie_id: int, db: AsyncSession) -> Movie:
+    movie = await db.get(Movie, movie_id, options=_MOVIE_RESPONSE_LOAD)
     if movie is None:
         raise HTTPException(status_code=404, detail="Movie not found")
     return movie
 
 
-def _get_person(person_id: int, db: Session) -> Person:
-    person = db.get(Person, person_id)
-    if person is None:
-        raise HTTPException(status_code=404, detail="Person not found")
-    return person
+def _new_movie(data: MovieCreate) -> Movie:
+    """Build a Movie (not yet added to a session) from a validated MovieCreate."""
+    return Movie(
+        title=data["title"],
+        description=data.get("description"),
+        release_date=data.get("release_date"),
+        rating=data.get("rating"),
+        movie_genre_entries=[MovieGenre(genre=g) for g in sorted(data["genres"])],
+    )
+
+
+async def _assert_movie_exists(movie_id: int, db: AsyncSession) -> None:
+    """404 unless the movie exists, for handlers that only need its id."""
+    if not await db.scalar(select(exists().where(Movie.id == movie_id))):
+        raise HTTPException(status_code=404, detail="Movie not found")
+
+
+async def _movie_page(
+    db: AsyncSession,
+    stmt: Select,
+    skip: int,
+    limit: int,
+    after_id: int | None = None,
+    include_total: bool = True,
+) -> tuple[list[Movie], int | None]:
+    """
+    One page of `stmt` (a select(Movie)) ordered by id, plus the total number of matches.
+    The total rides along as count(*) OVER () so page and count share one query.
+    With `after_id` the page is the `limit` movies after that id (keyset paging) and
+    `skip` is ignored. With include_total=False nothing is counted and the total is None.
+    """
+    stmt = stmt.options(*_MOVIE_RESPONSE_LOAD)
+    if not include_total:
+        if after_id is not None:
+            stmt = stmt.where(Movie.id > after_id)
+        else:
+            stmt = stmt.offset(skip)
+        items = (await db.execute(stmt.order_by(Movie.id).limit(limit))).scalars()
+        return list(items), None
+    if after_id is not None:
+        # The window would only count rows past after_id, and computing it over the
+        # whole result would undo the index range scan, so count separately.
+        items = (
+            await db.execute(stmt.where(Movie.id > after_id).order_by(Movie.id).limit(limit))
+        ).scalars()
+        total = (await db.execute(select(func.count()).select_from(stmt.subquery()))).scalar_one()
+        return list(items), total
+    rows = (
+        await db.execute(
+            stmt.add_columns(func.count().over().label("total"))
+            .order_by(Movie.id)
+            .offset(skip)
+            .limit(limit)
+        )
+    ).all()
+    if rows:
+        return [row.Movie for row in rows], rows[0].total
+    if skip == 0:
+        return [], 0
+    # Past the last page: no row to carry the window count, so count separately.
+    return [], (await db.execute(select(func.count()).select_from(stmt.subquery()))).scalar_one()
 
 
 @router.get(
@@ -53,17 +146,31 @@ def _get_person(person_id: int, db: Session) -> Person:
         200: {"description": "Paginated list of movies returned successfully."},
     },
 )
-def list_movies(
-    db: Session = Depends(get_db),
+async def list_movies(
+    db: AsyncSession = Depends(get_async_db),
     skip: int = Query(0, ge=0, description="Number of records to skip (for paging)."),
     limit: int = Query(
         20, ge=1, le=100, description="Maximum number of records to return (1–100)."
     ),
-) -> MovieListResponse:
+    after_id: int | None = Query(
+        None,
+        description="Keyset paging: return movies with id greater than this (pass the last "
+        "item's id from the previous page). Takes precedence over skip.",
+    ),
+    include_total: bool = Query(
+        True,
+        description="Count all movies into `total`. Set false (total is null) when paging "
+        "with after_id and stopping at a short page, e.g. for infinite scroll.",
+    ),
+) -> Response:
     """List movies with paging."""
-    total = db.query(Movie).count()
-    items = db.execute(select(Movie).offset(skip).limit(limit).order_by(Movie.id)).scalars().all()
-    return MovieListResponse(items=items, total=total, skip=skip, limit=limit)
+
+    async def load() -> str:
+        items, total = await _movie_page(db, select(Movie), skip, limit, after_id, include_total)
+        return MovieListResponse(items=items, total=total, skip=skip, limit=limit).model_dump_json()
+
+    key = ("movies", skip, limit, after_id, include_total)
+    return json_response(await response_cache.aget_or_set(key, load))
 
 
 @router.post(
@@ -75,48 +182,62 @@ def list_movies(
         200: {"description": "Paginated search results returned successfully."},
     },
 )
-def search_movies(
+async def search_movies(
     payload: MovieSearchRequest,
-    db: Session = Depends(get_db),
-) -> MovieListResponse:
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
     """Search movies with optional filters and paging. Genres and actor_ids use OR."""
     base = select(Movie)
     if payload.title and payload.title.strip():
         q = f"%{payload.title.strip()}%"
         base = base.where(or_(Movie.title.ilike(q), Movie.description.ilike(q)))
     if payload.genres:
-        base = (
-            base.join(MovieGenre, MovieGenre.movie_id == Movie.id)
-            .where(MovieGenre.genre.in_(payload.genres))
-            .distinct()
+        # EXISTS rather than join + DISTINCT: one row per movie, so the windowed total
+        # in _movie_page counts movies, not genre matches.
+        genre_exists = exists().where(
+            MovieGenre.movie_id == Movie.id,
+            MovieGenre.genre.in_(payload.genres),
         )
+        base = base.where(genre_exists)
     if payload.start_year is not None:
-        base = base.where(func.extract("year", Movie.release_date) >= payload.start_year)
+        # Bare column comparisons (not extract(year ...)) so ix_movies_release_date applies.
+        base = base.where(Movie.release_date >= date(payload.start_year, 1, 1))
     if payload.end_year is not None:
-        base = base.where(func.extract("year", Movie.release_date) <= payload.end_year)
+        base = base.where(Movie.release_date <= date(payload.end_year, 12, 31))
     if payload.director_id is not None:
-        director_exists = exists().where(
-            MoviePerson.movie_id == Movie.id,
-            MoviePerson.person_id == payload.director_id,
-            MoviePerson.role == MovieRole.Director,
+        # A plain join is safe here: uq_movie_person_role allows at most one
+        # (movie, director) row, so it never duplicates a movie.
+        base = base.join(
+            MoviePerson,
+            and_(
+                MoviePerson.movie_id == Movie.id,
+                MoviePerson.role == MovieRole.Director,
+                MoviePerson.person_id == payload.director_id,
+            ),
         )
-        base = base.where(director_exists)
     if payload.actor_ids:
-        actor_exists = exists().where(
-            MoviePerson.movie_id == Movie.id,
-            MoviePerson.person_id.in_(payload.actor_ids),
-            MoviePerson.role == MovieRole.Actor,
+        # Several listed actors can share a movie, so keep this a semi-join. Correlate
+        # only movies: movie_persons may also be joined above for the director.
+        actor_exists = (
+            select(1)
+            .where(
+                MoviePerson.movie_id == Movie.id,
+                MoviePerson.role == MovieRole.Actor,
+                MoviePerson.person_id.in_(payload.actor_ids),
+            )
+            .correlate(Movie)
+            .exists()
         )
         base = base.where(actor_exists)
 
-    count_stmt = select(func.count()).select_from(base.subquery())
-    total = db.execute(count_stmt).scalar_one()
-    items = (
-        db.execute(base.order_by(Movie.id).offset(payload.skip).limit(payload.limit))
-        .scalars()
-        .all()
+    items, total = await _movie_page(
+        db, base, payload.skip, payload.limit, payload.after_id, payload.include_total
+    )
+    return json_response(
+        MovieListResponse(
+            items=items, total=total, skip=payload.skip, limit=payload.limit
+        ).model_dump_json()
     )
-    return MovieListResponse(items=items, total=total, skip=payload.skip, limit=payload.limit)
 
 
 @router.get(
@@ -129,9 +250,13 @@ def search_movies(
         404: {"description": "Movie not found."},
     },
 )
-def get_movie(movie_id: int, db: Session = Depends(get_db)) -> Movie:
+async def get_movie(movie_id: int, db: AsyncSession = Depends(get_async_db)) -> Response:
     """Get a single movie by id."""
-    return _get_movie(movie_id, db)
+
+    async def load() -> str:
+        return MovieResponse.model_validate(await _get_movie(movie_id, db)).model_dump_json()
+
+    return json_response(await response_cache.aget_or_set(("movie", movie_id), load))
 
 
 @router.post(
@@ -144,19 +269,16 @@ def get_movie(movie_id: int, db: Session = Depends(get_db)) -> Movie:
         201: {"description": "Movie created successfully."},
     },
 )
-def create_movie(payload: MovieCreate, db: Session = Depends(get_db)) -> Movie:
-    movie = Movie(
-        title=payload.title,
-        description=payload.description,
-        release_date=payload.release_date,
-        rating=payload.rating,
-    )
+async def create_movie(
+    payload: MovieCreate = Body(openapi_examples=MOVIE_CREATE_EXAMPLES),
+    db: AsyncSession = Depends(get_async_db),
+) -> Movie:
+    movie = _new_movie(payload)
     db.add(movie)
-    db.flush()
-    for g in payload.genres:
-        db.add(MovieGenre(movie_id=movie.id, genre=g))
-    db.commit()
-    db.refresh(movie)
+    # The INSERT returns id and server defaults, and the session keeps them after
+    # commit, so the instance is complete without a refresh.
+    await db.commit()
+    response_cache.clear()
     return movie
 
 
@@ -170,25 +292,20 @@ def create_movie(payload: MovieCreate, db: Session = Depends(get_db)) -> Movie:
         201: {"description": "Movies created successfully."},
     },
 )
-def bulk_create_movies(payload: MovieBulkCreate, db: Session = Depends(get_db)) -> list[Movie]:
+async def bulk_create_movies(
+    payload: MovieBulkCreate = Body(openapi_examples=MOVIE_BULK_CREATE_EXAMPLES),
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
     """Create multiple movies. Maximum 300 per request."""
-    created: list[Movie] = []
-    for m in payload.movies:
-        movie = Movie(
-            title=m.title,
-            description=m.description,
-            release_date=m.release_date,
-            rating=m.rating,
-        )
-        db.add(movie)
-        db.flush()
-        for g in m.genres:
-            db.add(MovieGenre(movie_id=movie.id, genre=g))
-        created.append(movie)
-    db.commit()
-    for movie in created:
-        db.refresh(movie)
-    return created
+    created = [_new_movie(m) for m in payload.movies]
+    db.add_all(created)
+    # The flush batches all movies into one INSERT ... RETURNING (insertmanyvalues)
+    # and then all genre rows into one more; ids and server defaults come back with
+    # it, so no per-movie flush or refresh is needed.
+    await db.commit()
+    response_cache.clear()
+    body = ",".join(MovieResponse.model_validate(m).model_dump_json() for m in created)
+    return json_response(f"[{body}]", status_code=201)
 
 
 @router.patch(
@@ -201,23 +318,38 @@ def bulk_create_movies(payload: MovieBulkCreate, db: Session = Depends(get_db))
         404: {"description": "Movie not found."},
     },
 )
-def update_movie(
+async def update_movie(
     movie_id: int,
-    payload: MovieUpdate,
-    db: Session = Depends(get_db),
+    payload: MovieUpdate = Body(openapi_examples=MOVIE_UPDATE_EXAMPLES),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Movie:
     """Update a movie (partial update)."""
-    movie = _get_movie(movie_id, db)
     data = payload.model_dump(exclude_unset=True)
     genres = data.pop("genres", None)
-    for key, value in data.items():
-        setattr(movie, key, value)
+    if data:
+        # UPDATE ... RETURNING applies the columns, tells us whether the movie exists
+        # and returns the row (new updated_at included) in one round trip.
+        movie = await db.scalar(
+            update(Movie)
+            .where(Movie.id == movie_id)
+            .values(**data)
+            .returning(Movie)
+            .options(*_MOVIE_RESPONSE_LOAD)
+        )
+        if movie is None:
+            raise HTTPException(status_code=404, detail="Movie not found")
+    else:
+        movie = await _get_movie(movie_id, db)
     if genres is not None:
-        db.execute(delete(MovieGenre).where(MovieGenre.movie_id == movie_id))
-        for g in genres:
-            db.add(MovieGenre(movie_id=movie_id, genre=g))
-    db.commit()
-    db.refresh(movie)
+        # Diff against the entries already loaded with the movie: genres that stay are
+        # left alone, so an unchanged list writes nothing to movie_genres. Kept sorted
+        # like a loaded collection.
+        current = {e.genre for e in movie.movie_genre_entries}
+        kept = [e for e in movie.movie_genre_entries if e.genre in genres]
+        added = [MovieGenre(genre=g) for g in dict.fromkeys(genres) if g not in current]
+        movie.movie_genre_entries = sorted(kept + added, key=lambda e: e.genre)
+    await db.commit()
+    response_cache.clear()
     return movie
 
 
@@ -231,11 +363,15 @@ def update_movie(
         404: {"description": "Movie not found."},
     },
 )
-def delete_movie(movie_id: int, db: Session = Depends(get_db)) -> None:
+async def delete_movie(movie_id: int, db: AsyncSession = Depends(get_async_db)) -> None:
     """Delete a movie."""
-    movie = _get_movie(movie_id, db)
-    db.delete(movie)
-    db.commit()
+    # The genre, cast and review foreign keys are ON DELETE CASCADE, so one DELETE
+    # removes everything without loading the children for an ORM cascade.
+    result = await db.execute(delete(Movie).where(Movie.id == movie_id))
+    if result.rowcount == 0:
+        raise HTTPException(status_code=404, detail="Movie not found")
+    await db.commit()
+    response_cache.clear()
 
 
 @router.get(
@@ -248,26 +384,24 @@ def delete_movie(movie_id: int, db: Session = Depends(get_db)) -> None:
         404: {"description": "Movie not found."},
     },
 )
-def get_movie_persons(movie_id: int, db: Session = Depends(get_db)) -> list[PersonInMovieResponse]:
+async def get_movie_persons(
+    movie_id: int, db: AsyncSession = Depends(get_async_db)
+) -> list[MoviePerson]:
     """Get all persons associated with a movie."""
-    _get_movie(movie_id, db)
-    stmt = (
-        select(MoviePerson, Person)
-        .join(Person, MoviePerson.person_id == Person.id)
-        .where(MoviePerson.movie_id == movie_id)
-        .order_by(MoviePerson.role, Person.name)
-    )
-    results = db.execute(stmt).all()
-    return [
-        PersonInMovieResponse(
-            id=mp.id,
-            person_id=mp.person_id,
-            person_name=person.name,
-            person_email=person.email,
-            role=mp.role,
+    await _assert_movie_exists(movie_id, db)
+    # The join that orders by name also fills MoviePerson.person, which the response
+    # model reads name and email from. The statement never changes shape, so
+    # lambda_stmt builds and compiles it once and only rebinds movie_id afterwards.
+    stmt = lambda_stmt(
+        lambda: (
+            select(MoviePerson)
+            .join(MoviePerson.person)
+            .options(contains_eager(MoviePerson.person))
+            .where(MoviePerson.movie_id == movie_id)
+            .order_by(MoviePerson.role, Person.name)
         )
-        for mp, person in results
-    ]
+    )
+    return list((await db.execute(stmt)).scalars())
 
 
 @router.post(
@@ -284,80 +418,95 @@ def get_movie_persons(movie_id: int, db: Session = Depends(get_db)) -> list[Pers
         },
     },
 )
-def add_person_to_movie(
+async def add_person_to_movie(
     movie_id: int,
-    payload: list[AddPersonToMovieRequest],
-    db: Session = Depends(get_db),
+    payload: list[AddPersonToMovieRequest] = Body(openapi_examples=ADD_PERSONS_TO_MOVIE_EXAMPLES),
+    db: AsyncSession = Depends(get_async_db),
 ) -> list[MoviePerson]:
     """Add one or more persons to a movie in given roles (Actor, Director, Producer)."""
-    _get_movie(movie_id, db)
     directors_in_request = sum(1 for p in payload if p.role == MovieRole.Director)
     if directors_in_request > 1:
         raise HTTPException(
             status_code=409,
             detail="Movie can have only one director.",
         )
-    if directors_in_request == 1:
-        existing = (
-            db.execute(
-                select(MoviePerson).where(
-                    MoviePerson.movie_id == movie_id,
-                    MoviePerson.role == MovieRole.Director,
-                )
-            )
-            .scalars()
-            .first()
-        )
-        if existing is not None:
-            raise HTTPException(
-                status_code=409,
-                detail="Movie can have only one director.",
-            )
-    seen = set()
+    wanted: list[tuple[int, MovieRole]] = []
     for item in payload:
-        _get_person(item.person_id, db)
         key = (item.person_id, item.role)
-        if key in seen:
+        if key in wanted:
             raise HTTPException(
                 status_code=409,
                 detail=f"Duplicate assignment in request: person_id={item.person_id} role={item.role}.",
             )
-        seen.add(key)
-        existing_link = (
-            db.execute(
-                select(MoviePerson).where(
-                    MoviePerson.movie_id == movie_id,
-                    MoviePerson.person_id == item.person_id,
-                    MoviePerson.role == item.role,
-                )
-            )
-            .scalars()
-            .first()
-        )
-        if existing_link is not None:
+        wanted.append(key)
+    if not wanted:
+        await _assert_movie_exists(movie_id, db)
+        return []
+
+    # Insert optimistically: links that already exist are skipped by ON CONFLICT and
+    # missing from RETURNING, and an unknown movie or person fails its foreign key.
+    # Any problem rolls the whole request back, so nothing is half-applied.
+    stmt = (
+        pg_insert(MoviePerson)
+        .values([{"movie_id": movie_id, "person_id": p, "role": r} for p, r in wanted])
+        .on_conflict_do_nothing(constraint="uq_movie_person_role")
+        .returning(MoviePerson)
+    )
+    try:
+        created = list((await db.execute(stmt)).scalars())
+    except IntegrityError as e:
+        await db.rollback()
+        if e.orig.pgcode != _FOREIGN_KEY_VIOLATION:
             raise HTTPException(
                 status_code=409,
                 detail="This person is already assigned to this movie in this role.",
+            ) from e
+        # Postgres names only the first failing key; find every missing id to report.
+        person_ids = {person_id for person_id, _ in wanted}
+        movie_found, found = (
+            await db.execute(
+                select(
+                    exists().where(Movie.id == movie_id),
+                    select(func.array_agg(Person.id))
+                    .where(Person.id.in_(person_ids))
+                    .scalar_subquery(),
+                )
             )
-    created: list[MoviePerson] = []
-    for item in payload:
-        link = MoviePerson(
-            movie_id=movie_id,
-            person_id=item.person_id,
-            role=item.role,
-        )
-        db.add(link)
-        created.append(link)
-    try:
-        db.commit()
-        for link in created:
-            db.refresh(link)
-    except IntegrityError as e:
-        db.rollback()
+        ).one()
+        if not movie_found:
+            raise HTTPException(status_code=404, detail="Movie not found") from e
+        missing = sorted(person_ids - set(found or ()))
+        raise HTTPException(
+            status_code=404,
+            detail=f"Person not found: {', '.join(map(str, missing))}",
+        ) from e
+
+    # Before the director check: re-adding the movie's current director is a duplicate
+    # credit, not a second director.
+    if len(created) < len(wanted):
+        await db.rollback()
         raise HTTPException(
             status_code=409,
             detail="This person is already assigned to this movie in this role.",
-        ) from e
+        )
+    if directors_in_request:
+        inserted_ids = {mp.id for mp in created}
+        director_ids = (
+            await db.execute(
+                select(MoviePerson.id).where(
+                    MoviePerson.movie_id == movie_id, MoviePerson.role == MovieRole.Director
+                )
+            )
+        ).scalars()
+        if any(director_id not in inserted_ids for director_id in director_ids):
+            await db.rollback()
+            raise HTTPException(
+                status_code=409,
+                detail="Movie can have only one director.",
+            )
+    await db.commit()
+    # Cached person searches count and filter by credits.
+    response_cache.clear()
     return created
 
 
@@ -371,18 +520,15 @@ def add_person_to_movie(
         404: {"description": "Movie, person, or association not found."},
     },
 )
-def remove_person_from_movie(
+async def remove_person_from_movie(
     movie_id: int,
     person_id: int,
     role: MovieRole | None = Query(
         None, description="Specific role to remove. If not provided, removes all roles."
     ),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> None:
     """Remove a person from a movie in a specific role or all roles."""
-    _get_movie(movie_id, db)
-    _get_person(person_id, db)
-
     if role is not None:
         stmt = delete(MoviePerson).where(
             MoviePerson.movie_id == movie_id,
@@ -395,13 +541,27 @@ def remove_person_from_movie(
             MoviePerson.person_id == person_id,
         )
 
-    result = db.execute(stmt)
+    result = await db.execute(stmt)
     if result.rowcount == 0:
+        # Only a miss needs to know which side is absent: probe both in one round trip.
+        movie_found, person_found = (
+            await db.execute(
+                select(
+                    exists().where(Movie.id == movie_id),
+                    exists().where(Person.id == person_id),
+                )
+            )
+        ).one()
+        if not movie_found:
+            raise HTTPException(status_code=404, detail="Movie not found")
+        if not person_found:
+            raise HTTPException(status_code=404, detail="Person not found")
         raise HTTPException(
             status_code=404,
             detail="Association not found between this movie and person.",
         )
-    db.commit()
+    await db.commit()
+    response_cache.clear()
 
 
 @router.post(
@@ -417,11 +577,12 @@ def remove_person_from_movie(
 )
 async def upload_movie_image(
     movie_id: int,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(..., description="Image file to upload"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Movie:
     """Upload an image for a movie."""
-    movie = _get_movie(movie_id, db)
+    movie = await _get_movie(movie_id, db)
 
     # Validate file type
     allowed_types = ["image/jpeg", "image/jpg", "image/png", "image/gif", "image/webp"]
@@ -433,9 +594,13 @@ async def upload_movie_image(
 
     # Validate file size (max 10MB)
     max_size = 10 * 1024 * 1024  # 10MB
-    file.file.seek(0, 2)  # Seek to end
-    file_size = file.file.tell()
-    file.file.seek(0)  # Seek back to start
+    # The multipart parser counts the bytes as it spools the upload, so there is no
+    # need to seek through the temp file to size it.
+    file_size = file.size
+    if file_size is None:
+        file.file.seek(0, 2)  # Seek to end
+        file_size = file.file.tell()
+        file.file.seek(0)  # Seek back to start
 
     if file_size > max_size:
         raise HTTPException(
@@ -443,24 +608,29 @@ async def upload_movie_image(
             detail=f"File too large. Maximum size is {max_size // (1024 * 1024)}MB",
         )
 
-    # Delete old image if exists
+    # Save the new image and point the movie at it before touching the old one, so a
+    # failed save or commit leaves the current image in place.
     storage = get_storage()
-    if movie.image_path:
-        await storage.delete(movie.image_path)
-
-    # Save new image
+    old_path = movie.image_path
+    image_path = None
     try:
         image_path = await storage.save(file.file, file.filename or "image.jpg", file.content_type)
         movie.image_path = image_path
-        db.commit()
-        db.refresh(movie)
-        return movie
+        await db.commit()
     except Exception as e:
-        db.rollback()
+        await db.rollback()
+        if image_path:
+            await storage.delete(image_path)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to upload image: {str(e)}",
         ) from e
+    response_cache.clear()
+
+    # Nothing references the old image any more; remove it after the response is sent.
+    if old_path:
+        background_tasks.add_task(storage.delete, old_path)
+    return movie
 
 
 @router.get(
@@ -473,41 +643,51 @@ async def upload_movie_image(
         404: {"description": "Movie not found."},
     },
 )
-def get_movie_reviews(
+async def get_movie_reviews(
     movie_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     skip: int = Query(0, ge=0, description="Number of records to skip (for paging)."),
     limit: int = Query(
         20, ge=1, le=100, description="Maximum number of records to return (1–100)."
     ),
-) -> ReviewListResponse:
+) -> Response:
     """Get all reviews for a movie with pagination."""
-    _get_movie(movie_id, db)
-
-    # Get total count and average rating
-    total = db.query(Review).filter(Review.movie_id == movie_id).count()
-    avg_rating = db.query(func.avg(Review.rating)).filter(Review.movie_id == movie_id).scalar()
-
-    # Get paginated reviews
-    reviews = (
-        db.execute(
-            select(Review)
-            .where(Review.movie_id == movie_id)
-            .order_by(Review.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+
+    async def load() -> str:
+        # Count and average come from the movie's running review totals.
+        totals = (
+            await db.execute(
+                select(Movie.rating_sum, Movie.rating_count).where(Movie.id == movie_id)
+            )
+        ).one_or_none()
+        if totals is None:
+            raise HTTPException(status_code=404, detail="Movie not found")
+        rating_sum, rating_count = totals
+
+        # Get paginated reviews
+        reviews = (
+            (
+                await db.execute(
+                    select(Review)
+                    .where(Review.movie_id == movie_id)
+                    .order_by(Review.created_at.desc())
+                    .offset(skip)
+                    .limit(limit)
+                )
+            )
+            .scalars()
+            .all()
         )
-        .scalars()
-        .all()
-    )
 
-    return ReviewListResponse(
-        items=reviews,
-        total=total,
-        skip=skip,
-        limit=limit,
-        average_rating=round(float(avg_rating), 1) if avg_rating else None,
-    )
+        return ReviewListResponse(
+            items=reviews,
+            total=rating_count,
+            skip=skip,
+            limit=limit,
+            average_rating=round(rating_sum / rating_count, 1) if rating_count else None,
+        ).model_dump_json()
+
+    return json_response(await response_cache.aget_or_set(("reviews", movie_id, skip, limit), load))
 
 
 @router.post(
@@ -521,13 +701,25 @@ def get_movie_reviews(
         404: {"description": "Movie not found."},
     },
 )
-def create_movie_review(
+async def create_movie_review(
     movie_id: int,
-    payload: ReviewCreate,
-    db: Session = Depends(get_db),
+    payload: ReviewCreate = Body(openapi_examples=REVIEW_CREATE_EXAMPLES),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Review:
     """Create a new review for a movie."""
-    _get_movie(movie_id, db)
+    # Bumping the totals doubles as the existence check: no row updated, no movie.
+    totals = await db.execute(
+        update(Movie)
+        .where(Movie.id == movie_id)
+        .values(
+            rating_sum=Movie.rating_sum + payload.rating,
+            rating_count=Movie.rating_count + 1,
+            # Review totals are not an edit of the movie: keep onupdate off updated_at.
+            updated_at=Movie.updated_at,
+        )
+    )
+    if totals.rowcount == 0:
+        raise HTTPException(status_code=404, detail="Movie not found")
 
     review = Review(
         movie_id=movie_id,
@@ -536,8 +728,8 @@ def create_movie_review(
         content=payload.content,
     )
     db.add(review)
-    db.commit()
-    db.refresh(review)
+    await db.commit()
+    response_cache.clear()
     return review
 
 
@@ -551,17 +743,33 @@ def create_movie_review(
         404: {"description": "Movie or review not found."},
     },
 )
-def delete_movie_review(
+async def delete_movie_review(
     movie_id: int,
     review_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> None:
     """Delete a review."""
-    _get_movie(movie_id, db)
-
-    review = db.get(Review, review_id)
-    if review is None or review.movie_id != movie_id:
+    # Only the request whose DELETE removes the row gets its rating back, so concurrent
+    # deletes of the same review cannot both subtract it from the totals.
+    rating = await db.scalar(
+        delete(Review)
+        .where(Review.id == review_id, Review.movie_id == movie_id)
+        .returning(Review.rating)
+    )
+    if rating is None:
+        # Only a miss needs to know whether the movie exists.
+        await _assert_movie_exists(movie_id, db)
         raise HTTPException(status_code=404, detail="Review not found")
 
-    db.delete(review)
-    db.commit()
+    await db.execute(
+        update(Movie)
+        .where(Movie.id == movie_id)
+        .values(
+            rating_sum=Movie.rating_sum - rating,
+            rating_count=Movie.rating_count - 1,
+            # Review totals are not an edit of the movie: keep onupdate off updated_at.
+            updated_at=Movie.updated_at,
+        )
+    )
+    await db.commit()
+    response_cache.clear()
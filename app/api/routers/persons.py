@@ -1,13 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func, or_, select
+import hashlib
+from collections.abc import AsyncIterator, Sequence
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, exists, func, lambda_stmt, or_, select, update
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager, defaultload, lazyload, raiseload
 
+from app.api.responses import json_response
+from app.cache import response_cache
 from app.db.models.movie_genre import MovieGenre
 from app.db.models.movie_person import MoviePerson
 from app.db.models.movies import Movie
 from app.db.models.person import Person
-from app.db.session import get_db
+from app.db.session import get_async_db
+from app.openapi_examples import PERSON_CREATE_EXAMPLES, PERSON_UPDATE_EXAMPLES
 from app.schemas.movie_person import MovieInPersonResponse
 from app.schemas.person import (
     PersonCreate,
@@ -19,14 +27,77 @@ from app.schemas.person import (
 
 router = APIRouter(prefix="/persons", tags=["persons"])
 
+# Rows fetched per round trip when streaming a person's movies.
+_STREAM_BATCH_SIZE = 200
+
 
-def _get_person(person_id: int, db: Session) -> Person:
-    person = db.get(Person, person_id)
+async def _get_person(person_id: int, db: AsyncSession) -> Person:
+    person = await db.get(Person, person_id)
     if person is None:
         raise HTTPException(status_code=404, detail="Person not found")
     return person
 
 
+async def _assert_person_exists(person_id: int, db: AsyncSession) -> None:
+    """404 unless the person exists, for handlers that only need its id."""
+    if not await db.scalar(select(exists().where(Person.id == person_id))):
+        raise HTTPException(status_code=404, detail="Person not found")
+
+
+async def _person_page(
+    db: AsyncSession, stmt: Select, skip: int, limit: int, include_total: bool = True
+) -> tuple[list[PersonResponse], int | None]:
+    """
+    One page of `stmt` (a select(Person), at most one row per person) ordered by id, with
+    each person's movie_count, plus the total number of matches. The total rides along
+    as count(*) OVER () so page and count share one query; with include_total=False
+    nothing is counted and the total is None.
+    """
+    # Counted per returned person through ix_movie_persons_person_role (person_id is
+    # its leading column), rather than grouping the whole persons x movie_persons join
+    # before the LIMIT.
+    movie_count = (
+        select(func.count(MoviePerson.id))
+        .where(MoviePerson.person_id == Person.id)
+        .correlate(Person)
+        .scalar_subquery()
+    )
+    columns = [movie_count.label("movie_count")]
+    if include_total:
+        columns.append(func.count().over().label("total"))
+    rows = (
+        await db.execute(
+            stmt.add_columns(*columns)
+            .options(lazyload(Person.movie_persons))
+            .order_by(Person.id)
+            .offset(skip)
+            .limit(limit)
+        )
+    ).all()
+    if not include_total:
+        total = None
+    elif rows:
+        total = rows[0].total
+    elif skip == 0:
+        total = 0
+    else:
+        # Past the last page: no row to carry the window count, so count separately.
+        total = (await db.execute(select(func.count()).select_from(stmt.subquery()))).scalar_one()
+    # Rows come straight from the database, so build the responses without validation.
+    items = [
+        PersonResponse.model_construct(
+            id=person.id,
+            name=person.name,
+            email=person.email,
+            created_at=person.created_at,
+            updated_at=person.updated_at,
+            movie_count=movie_count,
+        )
+        for person, movie_count, *_ in rows
+    ]
+    return items, total
+
+
 @router.get(
     "",
     response_model=PersonListResponse,
@@ -36,41 +107,18 @@ def _get_person(person_id: int, db: Session) -> Person:
         200: {"description": "Paginated list of persons returned successfully."},
     },
 )
-def list_persons(
-    db: Session = Depends(get_db),
+async def list_persons(
+    db: AsyncSession = Depends(get_async_db),
     skip: int = Query(0, ge=0, description="Number of records to skip (for paging)."),
     limit: int = Query(
         20, ge=1, le=100, description="Maximum number of records to return (1–100)."
     ),
-) -> PersonListResponse:
+) -> Response:
     """List persons with paging and movie count."""
-    total = db.query(Person).count()
-
-    # Get persons with movie count
-    stmt = (
-        select(Person, func.count(MoviePerson.id).label("movie_count"))
-        .outerjoin(MoviePerson, MoviePerson.person_id == Person.id)
-        .group_by(Person.id)
-        .order_by(Person.id)
-        .offset(skip)
-        .limit(limit)
+    items, total = await _person_page(db, select(Person), skip, limit)
+    return json_response(
+        PersonListResponse(items=items, total=total, skip=skip, limit=limit).model_dump_json()
     )
-    results = db.execute(stmt).all()
-
-    # Build response with movie_count
-    items = []
-    for person, movie_count in results:
-        person_dict = {
-            "id": person.id,
-            "name": person.name,
-            "email": person.email,
-            "created_at": person.created_at,
-            "updated_at": person.updated_at,
-            "movie_count": movie_count,
-        }
-        items.append(PersonResponse(**person_dict))
-
-    return PersonListResponse(items=items, total=total, skip=skip, limit=limit)
 
 
 def _person_name_email_filter(q: str):
@@ -83,130 +131,56 @@ def _person_name_email_filter(q: str):
     "/search",
     response_model=PersonListResponse,
     summary="Search persons",
-    description="Search persons by search (name/email), movie_ids (OR), genres (OR), or roles (OR). Request body supports optional filters and paging (skip, limit). Includes movie count.",
+    description="Search persons by search (name/email), movie_ids (OR), genres (OR), or roles (OR). Request body supports optional filters and paging (skip, limit). Includes movie count. The response carries an ETag; send it back in If-None-Match to get 304 while the results are unchanged.",
     responses={
         200: {"description": "Paginated search results returned successfully."},
+        304: {"description": "Results unchanged since the ETag sent in If-None-Match."},
     },
 )
-def search_persons(
+async def search_persons(
     payload: PersonSearchRequest,
-    db: Session = Depends(get_db),
-) -> PersonListResponse:
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
     """Search persons with optional filters and paging (all roles). movie_ids, genres, and roles use OR. Includes movie count."""
-    search_q = payload.search.strip() if payload.search else ""
-    name_filter = _person_name_email_filter(search_q) if search_q else None
 
+    async def load() -> tuple[str, str]:
+        body = (await _search_persons(payload, db)).model_dump_json()
+        return body, f'"{hashlib.sha256(body.encode()).hexdigest()[:32]}"'
+
+    # Writes to persons, credits or genres clear the cache, so an unchanged ETag means
+    # unchanged results (within this process).
+    key = ("persons/search", payload.model_dump_json())
+    body, etag = await response_cache.aget_or_set(key, load)
+    if etag in (tag.strip() for tag in request.headers.get("if-none-match", "").split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+    return json_response(body, headers={"ETag": etag})
+
+
+async def _search_persons(payload: PersonSearchRequest, db: AsyncSession) -> PersonListResponse:
+    """Run the search described by `payload` (see search_persons)."""
+    base = select(Person)
+    search_q = payload.search.strip() if payload.search else ""
+    if search_q:
+        base = base.where(_person_name_email_filter(search_q))
     if payload.movie_ids or payload.genres or payload.roles:
-        base = select(Person).join(MoviePerson, MoviePerson.person_id == Person.id)
+        # EXISTS rather than join + DISTINCT keeps one row per person, so the windowed
+        # total counts persons. All conditions apply to the same credit.
+        credit = select(1).where(MoviePerson.person_id == Person.id)
         if payload.movie_ids:
-            base = base.where(MoviePerson.movie_id.in_(payload.movie_ids))
+            credit = credit.where(MoviePerson.movie_id.in_(payload.movie_ids))
         if payload.genres:
-            base = (
-                base.join(Movie, Movie.id == MoviePerson.movie_id)
-                .join(MovieGenre, MovieGenre.movie_id == Movie.id)
-                .where(MovieGenre.genre.in_(payload.genres))
-                .distinct()
+            credit = credit.where(
+                exists().where(
+                    MovieGenre.movie_id == MoviePerson.movie_id,
+                    MovieGenre.genre.in_(payload.genres),
+                )
             )
         if payload.roles:
-            base = base.where(MoviePerson.role.in_(payload.roles))
-        if name_filter is not None:
-            base = base.where(name_filter)
-        total = db.execute(
-            select(func.count()).select_from(base.distinct().subquery())
-        ).scalar_one()
-        ids_stmt = select(Person.id).join(MoviePerson, MoviePerson.person_id == Person.id)
-        if payload.movie_ids:
-            ids_stmt = ids_stmt.where(MoviePerson.movie_id.in_(payload.movie_ids))
-        if payload.genres:
-            ids_stmt = (
-                ids_stmt.join(Movie, Movie.id == MoviePerson.movie_id)
-                .join(MovieGenre, MovieGenre.movie_id == Movie.id)
-                .where(MovieGenre.genre.in_(payload.genres))
-                .distinct()
-            )
-        if payload.roles:
-            ids_stmt = ids_stmt.where(MoviePerson.role.in_(payload.roles))
-        if name_filter is not None:
-            ids_stmt = ids_stmt.where(name_filter)
-        ids_stmt = ids_stmt.distinct().order_by(Person.id).offset(payload.skip).limit(payload.limit)
-        ids = [row[0] for row in db.execute(ids_stmt).all()]
-        if not ids:
-            items = []
-        else:
-            # Get persons with movie count
-            stmt = (
-                select(Person, func.count(MoviePerson.id).label("movie_count"))
-                .outerjoin(MoviePerson, MoviePerson.person_id == Person.id)
-                .where(Person.id.in_(ids))
-                .group_by(Person.id)
-                .order_by(Person.id)
-            )
-            results = db.execute(stmt).all()
-            items = []
-            for person, movie_count in results:
-                person_dict = {
-                    "id": person.id,
-                    "name": person.name,
-                    "email": person.email,
-                    "created_at": person.created_at,
-                    "updated_at": person.updated_at,
-                    "movie_count": movie_count,
-                }
-                items.append(PersonResponse(**person_dict))
-        return PersonListResponse(items=items, total=total, skip=payload.skip, limit=payload.limit)
-
-    if name_filter is not None:
-        base = select(Person).where(name_filter)
-        total = db.execute(select(func.count()).select_from(base.subquery())).scalar_one()
-
-        # Get persons with movie count
-        stmt = (
-            select(Person, func.count(MoviePerson.id).label("movie_count"))
-            .outerjoin(MoviePerson, MoviePerson.person_id == Person.id)
-            .where(name_filter)
-            .group_by(Person.id)
-            .order_by(Person.id)
-            .offset(payload.skip)
-            .limit(payload.limit)
-        )
-        results = db.execute(stmt).all()
-        items = []
-        for person, movie_count in results:
-            person_dict = {
-                "id": person.id,
-                "name": person.name,
-                "email": person.email,
-                "created_at": person.created_at,
-                "updated_at": person.updated_at,
-                "movie_count": movie_count,
-            }
-            items.append(PersonResponse(**person_dict))
-        return PersonListResponse(items=items, total=total, skip=payload.skip, limit=payload.limit)
-
-    total = db.query(Person).count()
-
-    # Get persons with movie count
-    stmt = (
-        select(Person, func.count(MoviePerson.id).label("movie_count"))
-        .outerjoin(MoviePerson, MoviePerson.person_id == Person.id)
-        .group_by(Person.id)
-        .order_by(Person.id)
-        .offset(payload.skip)
-        .limit(payload.limit)
-    )
-    results = db.execute(stmt).all()
-    items = []
-    for person, movie_count in results:
-        person_dict = {
-            "id": person.id,
-            "name": person.name,
-            "email": person.email,
-            "created_at": person.created_at,
-            "updated_at": person.updated_at,
-            "movie_count": movie_count,
-        }
-        items.append(PersonResponse(**person_dict))
+            credit = credit.where(MoviePerson.role.in_(payload.roles))
+        base = base.where(credit.correlate(Person).exists())
 
+    items, total = await _person_page(db, base, payload.skip, payload.limit, payload.include_total)
     return PersonListResponse(items=items, total=total, skip=payload.skip, limit=payload.limit)
 
 
@@ -220,9 +194,9 @@ def search_persons(
         404: {"description": "Person not found."},
     },
 )
-def get_person(person_id: int, db: Session = Depends(get_db)) -> Person:
+async def get_person(person_id: int, db: AsyncSession = Depends(get_async_db)) -> Person:
     """Get a single person by id."""
-    return _get_person(person_id, db)
+    return await _get_person(person_id, db)
 
 
 @router.get(
@@ -235,44 +209,67 @@ def get_person(person_id: int, db: Session = Depends(get_db)) -> Person:
         404: {"description": "Person not found."},
     },
 )
-def get_person_movies(person_id: int, db: Session = Depends(get_db)) -> list[MovieInPersonResponse]:
+async def get_person_movies(
+    person_id: int, db: AsyncSession = Depends(get_async_db)
+) -> StreamingResponse:
     """Get all movies associated with a person."""
-    from app.db.models.movie_genre import MovieGenre
-
-    _get_person(person_id, db)
-    stmt = (
-        select(MoviePerson, Movie)
-        .join(Movie, MoviePerson.movie_id == Movie.id)
-        .where(MoviePerson.person_id == person_id)
-        .order_by(MoviePerson.role, Movie.title)
+    await _assert_person_exists(person_id, db)
+    # The join that orders by title also fills MoviePerson.movie; the genres come in one
+    # batched IN query. Nothing else is loaded, and raiseload makes any other
+    # relationship access fail instead of quietly issuing a query per row. As a
+    # lambda_stmt it is built and compiled once; later calls only rebind person_id.
+    stmt = lambda_stmt(
+        lambda: (
+            select(MoviePerson)
+            .join(MoviePerson.movie)
+            .options(
+                contains_eager(MoviePerson.movie).selectinload(Movie.movie_genre_entries),
+                defaultload(MoviePerson.movie).raiseload("*"),
+                raiseload("*"),
+            )
+            .where(MoviePerson.person_id == person_id)
+            .order_by(MoviePerson.role, Movie.title)
+        )
     )
-    results = db.execute(stmt).all()
-
-    # Fetch genres for each movie
-    movie_ids = [movie.id for _, movie in results]
-    genre_stmt = select(MovieGenre).where(MovieGenre.movie_id.in_(movie_ids))
-    genre_results = db.execute(genre_stmt).scalars().all()
-
-    # Group genres by movie_id
-    genres_by_movie: dict[int, list[int]] = {}
-    for mg in genre_results:
-        if mg.movie_id not in genres_by_movie:
-            genres_by_movie[mg.movie_id] = []
-        genres_by_movie[mg.movie_id].append(mg.genre)
-
-    return [
+    # Read the first batch before returning, so a failing query still gets a 500. Once
+    # streaming starts the 200 status line has been sent: an error while reading a
+    # later batch can only cut the response short, leaving truncated JSON.
+    result = await db.stream(stmt, execution_options={"yield_per": _STREAM_BATCH_SIZE})
+    batches = result.scalars().partitions()
+    first = await anext(batches, [])
+    return StreamingResponse(_stream_person_movies(first, batches), media_type="application/json")
+
+
+async def _stream_person_movies(
+    first: Sequence[MoviePerson], rest: AsyncIterator[Sequence[MoviePerson]]
+) -> AsyncIterator[str]:
+    """
+    Yield the JSON array of a person's MoviePerson rows, one chunk per batch read from
+    a server-side cursor, so a long filmography is never held in memory all at once.
+    The session stays open until the response is sent (FastAPI closes yield
+    dependencies after the response).
+    """
+    yield "[" + _movie_credits_json(first)
+    async for batch in rest:
+        yield "," + _movie_credits_json(batch)
+    yield "]"
+
+
+def _movie_credits_json(batch: Sequence[MoviePerson]) -> str:
+    """Comma-separated MovieInPersonResponse JSON objects for `batch`."""
+    return ",".join(
         MovieInPersonResponse(
             id=mp.id,
             movie_id=mp.movie_id,
-            movie_title=movie.title,
+            movie_title=mp.movie.title,
             role=mp.role,
-            image_path=movie.image_path,
-            rating=movie.rating,
-            release_date=movie.release_date.isoformat() if movie.release_date else None,
-            genres=genres_by_movie.get(movie.id, []),
-        )
-        for mp, movie in results
-    ]
+            image_path=mp.movie.image_path,
+            rating=mp.movie.rating,
+            release_date=mp.movie.release_date,
+            genres=mp.movie.genres,
+        ).model_dump_json()
+        for mp in batch
+    )
 
 
 @router.post(
@@ -286,18 +283,21 @@ def get_person_movies(person_id: int, db: Session = Depends(get_db)) -> list[Mov
         409: {"description": "A person with this email already exists."},
     },
 )
-def create_person(payload: PersonCreate, db: Session = Depends(get_db)) -> Person:
+async def create_person(
+    payload: PersonCreate = Body(openapi_examples=PERSON_CREATE_EXAMPLES),
+    db: AsyncSession = Depends(get_async_db),
+) -> Person:
     person = Person(name=payload.name, email=payload.email)
     db.add(person)
     try:
-        db.commit()
-        db.refresh(person)
+        await db.commit()
     except IntegrityError as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=409,
             detail="A person with this email already exists.",
         ) from e
+    response_cache.clear()
     return person
 
 
@@ -311,18 +311,28 @@ def create_person(payload: PersonCreate, db: Session = Depends(get_db)) -> Perso
         404: {"description": "Person not found."},
     },
 )
-def update_person(
+async def update_person(
     person_id: int,
-    payload: PersonUpdate,
-    db: Session = Depends(get_db),
+    payload: PersonUpdate = Body(openapi_examples=PERSON_UPDATE_EXAMPLES),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Person:
     """Update a person (partial update)."""
-    person = _get_person(person_id, db)
     data = payload.model_dump(exclude_unset=True)
-    for key, value in data.items():
-        setattr(person, key, value)
-    db.commit()
-    db.refresh(person)
+    if not data:
+        return await _get_person(person_id, db)
+    # UPDATE ... RETURNING applies the fields, tells us whether the person exists and
+    # returns the row (new updated_at included) in one round trip.
+    person = await db.scalar(
+        update(Person)
+        .where(Person.id == person_id)
+        .values(**data)
+        .returning(Person)
+        .options(lazyload(Person.movie_persons))
+    )
+    if person is None:
+        raise HTTPException(status_code=404, detail="Person not found")
+    await db.commit()
+    response_cache.clear()
     return person
 
 
@@ -336,8 +346,9 @@ def update_person(
         404: {"description": "Person not found."},
     },
 )
-def delete_person(person_id: int, db: Session = Depends(get_db)) -> None:
+async def delete_person(person_id: int, db: AsyncSession = Depends(get_async_db)) -> None:
     """Delete a person."""
-    person = _get_person(person_id, db)
-    db.delete(person)
-    db.commit()
+    person = await _get_person(person_id, db)
+    await db.delete(person)
+    await db.commit()
+    response_cache.clear()
@@ -0,0 +1,79 @@
+"""In-process TTL cache for responses of hot read endpoints."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class TTLCache:
+    """
+    Thread-safe key -> value cache whose entries expire after `ttl` seconds.
+
+    Writers call clear() after committing a change. A value computed while a clear
+    happened is returned to its caller but not stored, so a read racing a write cannot
+    put pre-write data back into the cache. Entries are per process: with several
+    workers, another worker can serve a stale value for up to `ttl` seconds.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 10_000) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # Oldest write first, so eviction pops from the front.
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """Return the cached value for `key`, computing and storing it with `factory` on a miss."""
+        hit, value, generation = self._lookup(key)
+        if hit:
+            return value
+        value = factory()
+        self._store(key, value, generation)
+        return value
+
+    async def aget_or_set(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """Like get_or_set, for a coroutine factory."""
+        hit, value, generation = self._lookup(key)
+        if hit:
+            return value
+        value = await factory()
+        self._store(key, value, generation)
+        return value
+
+    def _lookup(self, key: Hashable) -> tuple[bool, Any, int]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return True, entry[1], self._generation
+            return False, None, self._generation
+
+    def _store(self, key: Hashable, value: Any, generation: int) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            if key in self._data:
+                # Overwriting frees no room, so evict nothing; the key is now the newest.
+                self._data.move_to_end(key)
+            elif len(self._data) >= self.maxsize:
+                self._data.popitem(last=False)
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._generation += 1
+
+
+# Movie, movie list, movie review and person search responses.
+# RESPONSE_CACHE_TTL=0 disables caching.
+response_cache = TTLCache(ttl=float(os.getenv("RESPONSE_CACHE_TTL", "15")))
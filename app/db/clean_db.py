@@ -2,16 +2,30 @@
 
 from __future__ import annotations
 
-from sqlalchemy import text
+from sqlalchemy import Connection, text
 
 from app.db.session import engine
 
 
-def run_clean() -> None:
-    """Truncate movies and persons (and dependent tables via CASCADE)."""
-    with engine.connect() as conn:
-        conn.execute(text("TRUNCATE movies, persons CASCADE"))
-        conn.commit()
+def run_clean(bind: Connection | None = None) -> None:
+    """
+    Truncate all app tables in one statement and restart their id sequences.
+    With `bind`, run on that connection and leave committing to the caller.
+    """
+    stmt = text(
+        "TRUNCATE TABLE reviews, movie_genres, movie_persons, movies, persons "
+        "RESTART IDENTITY CASCADE"
+    )
+    if bind is not None:
+        # The caller's transaction may hold more than the wipe (the admin reset also
+        # seeds in it), so its commit keeps the normal durability.
+        bind.execute(stmt)
+        return
+    with engine.begin() as conn:
+        # A crash can lose at most this (rerunnable) wipe, never corrupt data, so don't
+        # make the commit wait for the WAL fsync. SET LOCAL ends with the transaction.
+        conn.execute(text("SET LOCAL synchronous_commit = off"))
+        conn.execute(stmt)
 
 
 def main() -> None:
@@ -1,10 +1,29 @@
 import os
 
 
-def database_url() -> str:
+def database_url(driver: str = "psycopg2") -> str:
+    """Postgres URL from DB_* env vars; pass driver="asyncpg" for the async engine."""
     host = os.getenv("DB_HOST", "localhost")
     port = os.getenv("DB_PORT", "5432")
     user = os.getenv("DB_USER", "postgres")
     password = os.getenv("DB_PASSWORD", "postgres")
     name = os.getenv("DB_NAME", "postgres")
-    return f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{name}"
+    return f"postgresql+{driver}://{user}:{password}@{host}:{port}/{name}"
+
+
+def engine_options() -> dict:
+    """Pool and statement cache settings for create_engine (pool overridable via env)."""
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "20")),
+        # Seconds to wait for a free connection before raising instead of hanging.
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        # LIFO reuses the most recently returned connection, letting idle overflow
+        # connections time out instead of being cycled round-robin.
+        "pool_use_lifo": True,
+        "pool_pre_ping": True,
+        # Compiled-SQL cache entries per engine (default 500). Search builds a distinct
+        # statement shape per combination of filters, so leave room beyond the default.
+        "query_cache_size": 1200,
+    }
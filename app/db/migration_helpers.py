@@ -0,0 +1,44 @@
+"""Helpers shared by Alembic revision scripts."""
+
+from __future__ import annotations
+
+from alembic import op
+
+# Labels of the Postgres `genre` enum, in declaration order (position i is Genre value i).
+# Kept as literals rather than derived from app.db.models.genre so revisions keep
+# describing the schema they created. Since 0013 movie_genres.genre is a smallint and the
+# enum type is gone, so new genres need no revision.
+GENRE_VALUES: tuple[str, ...] = (
+    "Action",
+    "Comedy",
+    "Drama",
+    "Horror",
+    "SciFi",
+    "Thriller",
+    "Fantasy",
+    "Romance",
+    "Animation",
+    "Adventure",
+    "Family",
+    "Mystery",
+    "War",
+    "Western",
+    "Crime",
+    "Documentary",
+    "Biography",
+    "History",
+)
+
+
+def add_enum_value(name: str, value: str) -> None:
+    """
+    Add a value to an existing Postgres enum type (e.g. genre, movie_role).
+
+    ALTER TYPE ... ADD VALUE only updates the catalog, unlike recreating the type,
+    which rewrites every table that uses it. Postgres will not let a new value be
+    used in the transaction that added it, so the statement runs in an autocommit
+    block and later revisions in the same upgrade can rely on it.
+    """
+    quoted = value.replace("'", "''")
+    with op.get_context().autocommit_block():
+        op.execute(f"ALTER TYPE {name} ADD VALUE IF NOT EXISTS '{quoted}'")
@@ -1,7 +1,7 @@
-from enum import Enum
+from enum import IntEnum
 
 
-class Genre(Enum):
+class Genre(IntEnum):
     Action = 1
     Comedy = 2
     Drama = 3
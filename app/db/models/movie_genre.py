@@ -1,13 +1,29 @@
 from __future__ import annotations
 
-from sqlalchemy import Enum as SAEnum
-from sqlalchemy import ForeignKey, Integer, PrimaryKeyConstraint
+from sqlalchemy import ForeignKey, Integer, PrimaryKeyConstraint, SmallInteger
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.types import TypeDecorator
 
 from app.db.base import Base
 from app.db.models.genre import Genre
 
 
+class GenreType(TypeDecorator):
+    """
+    Genre stored as its smallint value: 2 bytes per row and index entry, a plain int
+    on the wire, and adding a genre needs no schema change.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: int | None, dialect) -> int | None:
+        return None if value is None else int(value)
+
+    def process_result_value(self, value: int | None, dialect) -> Genre | None:
+        return None if value is None else Genre(value)
+
+
 class MovieGenre(Base):
     """Association: a movie has many genres. Composite PK (movie_id, genre)."""
 
@@ -19,6 +35,6 @@ class MovieGenre(Base):
         ForeignKey("movies.id", ondelete="CASCADE"),
         nullable=False,
     )
-    genre: Mapped[Genre] = mapped_column(SAEnum(Genre, name="genre"), nullable=False)
+    genre: Mapped[Genre] = mapped_column(GenreType(), nullable=False)
 
     movie: Mapped["Movie"] = relationship("Movie", back_populates="movie_genre_entries")
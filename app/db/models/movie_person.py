@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from sqlalchemy import Enum as SAEnum
-from sqlalchemy import ForeignKey, Integer, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, Integer, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -20,6 +20,8 @@ class MoviePerson(Base):
     __tablename__ = "movie_persons"
     __table_args__ = (
         UniqueConstraint("movie_id", "person_id", "role", name="uq_movie_person_role"),
+        Index("ix_movie_persons_movie_role_person", "movie_id", "role", "person_id"),
+        Index("ix_movie_persons_person_role", "person_id", "role"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -33,4 +35,5 @@ class MoviePerson(Base):
 
     # Relationships (optional, for convenient navigation)
     movie: Mapped["Movie"] = relationship("Movie", back_populates="movie_persons")
-    person: Mapped["Person"] = relationship("Person", back_populates="movie_persons")
+    # lazy="raise": load it explicitly (the async session cannot lazy load on access).
+    person: Mapped["Person"] = relationship("Person", back_populates="movie_persons", lazy="raise")
@@ -4,6 +4,7 @@ import datetime as dt
 from typing import TYPE_CHECKING
 
 from sqlalchemy import Date, DateTime, Float, Integer, String, Text, func
+from sqlalchemy.ext.associationproxy import AssociationProxy, association_proxy
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -17,13 +18,19 @@ if TYPE_CHECKING:
 
 class Movie(Base):
     __tablename__ = "movies"
+    # Fetch updated_at (onupdate=now()) via UPDATE ... RETURNING so handlers need no refresh.
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    release_date: Mapped[dt.date | None] = mapped_column(Date, nullable=True)
+    release_date: Mapped[dt.date | None] = mapped_column(Date, nullable=True, index=True)
     rating: Mapped[float | None] = mapped_column(Float, nullable=True)
     image_path: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    # Running totals over this movie's reviews, kept in step by the review endpoints so
+    # the review list can report the average without aggregating the reviews table.
+    rating_sum: Mapped[float] = mapped_column(Float, nullable=False, server_default="0")
+    rating_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
     created_at: Mapped[dt.datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
@@ -34,11 +41,14 @@ class Movie(Base):
         onupdate=func.now(),
     )
 
+    # Loaded in genre order, and the handlers keep new collections sorted, so `genres`
+    # reads the entries as they are instead of sorting on every access.
     movie_genre_entries: Mapped[list[MovieGenre]] = relationship(
         "MovieGenre",
         back_populates="movie",
         cascade="all, delete-orphan",
         lazy="selectin",
+        order_by=MovieGenre.genre,
     )
     movie_persons: Mapped[list[MoviePerson]] = relationship(
         "MoviePerson",
@@ -53,10 +63,5 @@ class Movie(Base):
         lazy="selectin",
     )
 
-    @property
-    def genres(self) -> list[Genre]:
-        """Ordered list of genres for this movie (by enum value)."""
-        return sorted(
-            (e.genre for e in self.movie_genre_entries),
-            key=lambda g: g.value,
-        )
+    # Genres of this movie, ordered by value.
+    genres: AssociationProxy[list[Genre]] = association_proxy("movie_genre_entries", "genre")
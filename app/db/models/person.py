@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 
 class Person(Base):
     __tablename__ = "persons"
+    # Fetch updated_at (onupdate=now()) via UPDATE ... RETURNING so handlers need no refresh.
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
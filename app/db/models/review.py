@@ -3,7 +3,7 @@ from __future__ import annotations
 import datetime as dt
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, Text, desc, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -14,10 +14,18 @@ if TYPE_CHECKING:
 
 class Review(Base):
     __tablename__ = "reviews"
+    __table_args__ = (
+        Index(
+            "ix_reviews_movie_covering",
+            "movie_id",
+            desc("created_at"),
+            postgresql_include=["rating"],
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     movie_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("movies.id", ondelete="CASCADE"), nullable=False, index=True
+        Integer, ForeignKey("movies.id", ondelete="CASCADE"), nullable=False
     )
     author_name: Mapped[str] = mapped_column(String(255), nullable=False)
     rating: Mapped[float] = mapped_column(Float, nullable=False)  # Individual review rating (0-10)
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
-import json
+import functools
 import os
 import random
 import re
 import shutil
-from datetime import date, datetime
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
+from types import MappingProxyType
 
-from sqlalchemy import select
+import orjson
+from sqlalchemy import Connection, insert, or_, select, text
 from sqlalchemy.orm import Session
 
 from app.db.models.genre import Genre
@@ -22,101 +26,239 @@ from app.db.models.review import Review
 from app.db.models.role import MovieRole
 from app.db.session import SessionLocal
 
+# Rows per multi-row INSERT issued while seeding.
+SEED_BATCH_SIZE = 1000
+
+# Postgres advisory lock key held while checking for and writing the seed data.
+SEED_LOCK_KEY = 0x5EED
+
+# Files in app/db/images that are copied to uploads and assigned to seeded movies.
+IMAGE_SUFFIXES = (".jpg", ".jpeg", ".png", ".gif", ".webp")
+
+# Author names given to seeded reviews.
+REVIEWER_NAMES: tuple[str, ...] = (
+    "Alex Johnson",
+    "Maria Garcia",
+    "David Chen",
+    "Sarah Williams",
+    "Michael Brown",
+    "Emily Davis",
+    "James Wilson",
+    "Jessica Martinez",
+    "Robert Anderson",
+    "Linda Taylor",
+    "Christopher Lee",
+    "Patricia White",
+    "Daniel Harris",
+    "Jennifer Clark",
+    "Matthew Lewis",
+    "Lisa Robinson",
+    "Andrew Walker",
+    "Karen Hall",
+    "Joshua Allen",
+    "Nancy Young",
+    "Ryan King",
+    "Betty Wright",
+    "Kevin Lopez",
+    "Sandra Hill",
+    "Brian Scott",
+    "Carol Green",
+    "Jason Adams",
+    "Laura Baker",
+    "Steven Nelson",
+    "Dorothy Carter",
+)
+
+# data.json credit columns and the role each one is seeded with.
+CREDIT_ROLES: tuple[tuple[str, MovieRole], ...] = (
+    ("Actor", MovieRole.Actor),
+    ("Director", MovieRole.Director),
+    ("Producer", MovieRole.Producer),
+)
+
 # Map JSON genre strings to Genre enum (primary mapping; compound genres map to one).
-GENRE_MAP: dict[str, Genre] = {
-    "action": Genre.Action,
-    "comedy": Genre.Comedy,
-    "drama": Genre.Drama,
-    "horror": Genre.Horror,
-    "sci-fi": Genre.SciFi,
-    "science fiction": Genre.SciFi,
-    "thriller": Genre.Thriller,
-    "fantasy": Genre.Fantasy,
-    "romance": Genre.Romance,
-    "animation": Genre.Animation,
-    "adventure": Genre.Adventure,
-    "family": Genre.Family,
-    "mystery": Genre.Mystery,
-    "war": Genre.War,
-    "western": Genre.Western,
-    "crime": Genre.Crime,
-    "documentary": Genre.Documentary,
-    "biography": Genre.Biography,
-    "history": Genre.History,
-    # Compound / variants
-    "crime thriller": Genre.Thriller,
-    "war drama": Genre.Drama,
-    "music drama": Genre.Drama,
-    "psychological thriller": Genre.Thriller,
-    "disaster": Genre.Drama,
-    "spy thriller": Genre.Thriller,
-    "political drama": Genre.Drama,
-    "sci-fi thriller": Genre.SciFi,
-    "survival": Genre.Adventure,
-    "crime drama": Genre.Crime,
-    "historical drama": Genre.History,
-    "survival thriller": Genre.Thriller,
-    "political thriller": Genre.Thriller,
-    "tech thriller": Genre.Thriller,
-    "action drama": Genre.Action,
-    "sci-fi drama": Genre.SciFi,
-    "action thriller": Genre.Action,
-    "sci-fi horror": Genre.Horror,
-    "disaster thriller": Genre.Thriller,
-    "mystery thriller": Genre.Thriller,
-    "mystery drama": Genre.Mystery,
-    "legal drama": Genre.Drama,
-    "psychological drama": Genre.Drama,
-    "cyberpunk": Genre.SciFi,
-}
+# Read-only: it is shared module state.
+GENRE_MAP: Mapping[str, Genre] = MappingProxyType(
+    {
+        "action": Genre.Action,
+        "comedy": Genre.Comedy,
+        "drama": Genre.Drama,
+        "horror": Genre.Horror,
+        "sci-fi": Genre.SciFi,
+        "science fiction": Genre.SciFi,
+        "thriller": Genre.Thriller,
+        "fantasy": Genre.Fantasy,
+        "romance": Genre.Romance,
+        "animation": Genre.Animation,
+        "adventure": Genre.Adventure,
+        "family": Genre.Family,
+        "mystery": Genre.Mystery,
+        "war": Genre.War,
+        "western": Genre.Western,
+        "crime": Genre.Crime,
+        "documentary": Genre.Documentary,
+        "biography": Genre.Biography,
+        "history": Genre.History,
+        # Compound / variants
+        "crime thriller": Genre.Thriller,
+        "war drama": Genre.Drama,
+        "music drama": Genre.Drama,
+        "psychological thriller": Genre.Thriller,
+        "disaster": Genre.Drama,
+        "spy thriller": Genre.Thriller,
+        "political drama": Genre.Drama,
+        "sci-fi thriller": Genre.SciFi,
+        "survival": Genre.Adventure,
+        "crime drama": Genre.Crime,
+        "historical drama": Genre.History,
+        "survival thriller": Genre.Thriller,
+        "political thriller": Genre.Thriller,
+        "tech thriller": Genre.Thriller,
+        "action drama": Genre.Action,
+        "sci-fi drama": Genre.SciFi,
+        "action thriller": Genre.Action,
+        "sci-fi horror": Genre.Horror,
+        "disaster thriller": Genre.Thriller,
+        "mystery thriller": Genre.Thriller,
+        "mystery drama": Genre.Mystery,
+        "legal drama": Genre.Drama,
+        "psychological drama": Genre.Drama,
+        "cyberpunk": Genre.SciFi,
+    }
+)
+
+
+_WS_RE = re.compile(r"\s+")
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
 
 
 def _normalize_genre(s: str) -> str:
-    return re.sub(r"\s+", " ", s.strip().lower())
+    return _WS_RE.sub(" ", s.strip().lower())
 
 
 def _parse_genre(raw: str) -> Genre:
     key = _normalize_genre(raw)
-    if key in GENRE_MAP:
-        return GENRE_MAP[key]
-    # Try first word only
-    first = key.split()[0] if key else ""
-    return GENRE_MAP.get(first, Genre.Drama)
+    # Fall back to the first word only (keys are single-spaced), then to Drama.
+    return GENRE_MAP.get(key) or GENRE_MAP.get(key.partition(" ")[0], Genre.Drama)
 
 
 def _person_email(name: str) -> str:
-    slug = re.sub(r"[^a-z0-9]+", ".", name.strip().lower()).strip(".")
+    slug = _SLUG_RE.sub(".", name.strip().lower()).strip(".")
     return f"{slug}@seed.example.com"
 
 
-def _get_or_create_person(db: Session, name: str) -> Person:
-    person = db.execute(select(Person).where(Person.name == name)).scalars().one_or_none()
-    if person:
-        return person
-    email = _person_email(name)
-    # Ensure email is unique (same name can appear with different casing)
-    existing = db.execute(select(Person).where(Person.email == email)).scalars().one_or_none()
-    if existing:
-        return existing
-    person = Person(name=name, email=email)
-    db.add(person)
-    db.flush()
-    return person
+def _batches(rows: list[dict], size: int = SEED_BATCH_SIZE):
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
+
+
+def _insert_returning_ids(db: Session, model: type, rows: list[dict]) -> list[int]:
+    """Insert `rows` in batches and return the new primary keys in row order."""
+    stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+    ids: list[int] = []
+    for batch in _batches(rows):
+        # render_nulls keeps rows with None values in the same multi-row INSERT.
+        ids.extend(db.execute(stmt, batch, execution_options={"render_nulls": True}).scalars())
+    return ids
+
+
+def _insert_all(db: Session, model: type, rows: list[dict]) -> None:
+    for batch in _batches(rows):
+        db.execute(insert(model), batch, execution_options={"render_nulls": True})
+
+
+def _resolve_persons(db: Session, names: list[str]) -> dict[str, int]:
+    """
+    Map each name to a person id, creating the missing persons.
+    A name is matched against existing persons by name, then by its seed email (the
+    same name can appear with different casing).
+    """
+    emails = {name: _person_email(name) for name in names}
+    existing = db.execute(
+        select(Person.id, Person.name, Person.email).where(
+            or_(Person.name.in_(names), Person.email.in_(set(emails.values())))
+        )
+    ).all()
+    by_name = {p.name: p.id for p in existing}
+    by_email = {p.email: p.id for p in existing}
+
+    ids: dict[str, int] = {}
+    new_rows: list[dict] = []
+    pending: dict[str, list[str]] = {}
+    for name in names:
+        email = emails[name]
+        if name in by_name:
+            ids[name] = by_name[name]
+        elif email in by_email:
+            ids[name] = by_email[email]
+        elif email in pending:
+            pending[email].append(name)
+        else:
+            pending[email] = [name]
+            new_rows.append({"name": name, "email": email})
+
+    for row, person_id in zip(new_rows, _insert_returning_ids(db, Person, new_rows), strict=True):
+        for name in pending[row["email"]]:
+            ids[name] = person_id
+    return ids
 
 
 def _parse_date(value: str | None) -> date | None:
     if not value:
         return None
     try:
-        return datetime.strptime(value.strip()[:10], "%Y-%m-%d").date()
-    except (ValueError, TypeError):
+        return date.fromisoformat(value.strip()[:10])
+    except ValueError:
         return None
 
 
-def run_seed(data_path: Path | None = None) -> bool:
+@functools.lru_cache(maxsize=1)
+def _seed_image_sources() -> tuple[tuple[str, str], ...]:
+    """
+    (file name, path) of each seed image in app/db/images. Cached: the images ship
+    with the code, so later seeds and resets in this process reuse the first scan.
+    """
+    images_dir = Path(__file__).resolve().parent / "images"
+    if not images_dir.is_dir():
+        return ()
+    # scandir's entries carry the file type, so listing costs no stat per file.
+    with os.scandir(images_dir) as entries:
+        return tuple(
+            (entry.name, entry.path)
+            for entry in entries
+            if entry.is_file() and entry.name.lower().endswith(IMAGE_SUFFIXES)
+        )
+
+
+def _seed_images(uploads_dir: Path) -> tuple[str, ...]:
+    """
+    Copy the seed images into `uploads_dir`/seed and return their paths relative to
+    `uploads_dir`. Runs on every seed: the uploads may have been deleted since the
+    last one, so only images already present are skipped.
+    """
+    sources = _seed_image_sources()
+    if not sources:
+        return ()
+    seed_images_subdir = uploads_dir / "seed"
+    seed_images_subdir.mkdir(parents=True, exist_ok=True)
+    copies = [
+        (path, dest_path)
+        for name, path in sources
+        if not (dest_path := seed_images_subdir / name).exists()
+    ]
+    if copies:
+        # The copies are I/O bound and release the GIL, so overlap them.
+        with ThreadPoolExecutor(max_workers=min(8, len(copies))) as pool:
+            list(pool.map(lambda pair: shutil.copy2(*pair), copies))
+    return tuple(f"seed/{name}" for name, _ in sources)
+
+
+def run_seed(data_path: Path | None = None, bind: Connection | None = None) -> bool:
     """
     Load data.json and seed the database if it has no movies.
     Returns True if seeding was performed, False if skipped (DB already has data).
+    With `bind`, the rows are written inside that connection's transaction, which
+    the caller commits.
     """
     if data_path is None:
         data_path = Path(__file__).resolve().parent / "data.json"
@@ -131,77 +273,49 @@ def run_seed(data_path: Path | None = None) -> bool:
     reviews_data = []
 
     if ratings_path.exists():
-        with open(ratings_path, encoding="utf-8") as f:
-            ratings_data = json.load(f)
+        ratings_data = orjson.loads(ratings_path.read_bytes())
 
     if reviews_path.exists():
-        with open(reviews_path, encoding="utf-8") as f:
-            reviews_data = json.load(f)
+        reviews_data = orjson.loads(reviews_path.read_bytes())
 
     # Get uploads directory from environment or default
     uploads_dir = Path(os.getenv("STORAGE_LOCAL_PATH", "./uploads"))
     uploads_dir.mkdir(parents=True, exist_ok=True)
 
-    # Copy seed images from app/db/images to uploads directory
-    images_dir = Path(__file__).resolve().parent / "images"
-    available_images: list[str] = []
-    if images_dir.exists() and images_dir.is_dir():
-        seed_images_subdir = uploads_dir / "seed"
-        seed_images_subdir.mkdir(parents=True, exist_ok=True)
-
-        for img in images_dir.iterdir():
-            if img.is_file() and img.suffix.lower() in {".jpg", ".jpeg", ".png", ".gif", ".webp"}:
-                dest_path = seed_images_subdir / img.name
-                if not dest_path.exists():
-                    shutil.copy2(img, dest_path)
-                # Store relative path for database (relative to uploads directory)
-                available_images.append(f"seed/{img.name}")
-
-    db = SessionLocal()
-    try:
-        existing = db.execute(select(Movie).limit(1)).scalars().one_or_none()
-        if existing is not None:
+    available_images = _seed_images(uploads_dir)
+
+    # One transaction for the whole seed, committed when the block exits (rolled back if
+    # it raises). A Session joined to a connection that is already in a transaction
+    # does not commit that transaction; that stays with the caller.
+    db = Session(bind=bind) if bind is not None else SessionLocal()
+    with db, db.begin():
+        # Workers starting together all try to seed: serialize them on a transaction
+        # advisory lock, so the first seeds and the rest then find its movies.
+        db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SEED_LOCK_KEY})
+        if db.execute(select(Movie.id).limit(1)).first() is not None:
             return False
 
-        with open(data_path, encoding="utf-8") as f:
-            rows = json.load(f)
+        rows = orjson.loads(data_path.read_bytes())
 
         if not rows:
             return False
 
-        # List of reviewer names for seeding
-        reviewer_names = [
-            "Alex Johnson",
-            "Maria Garcia",
-            "David Chen",
-            "Sarah Williams",
-            "Michael Brown",
-            "Emily Davis",
-            "James Wilson",
-            "Jessica Martinez",
-            "Robert Anderson",
-            "Linda Taylor",
-            "Christopher Lee",
-            "Patricia White",
-            "Daniel Harris",
-            "Jennifer Clark",
-            "Matthew Lewis",
-            "Lisa Robinson",
-            "Andrew Walker",
-            "Karen Hall",
-            "Joshua Allen",
-            "Nancy Young",
-            "Ryan King",
-            "Betty Wright",
-            "Kevin Lopez",
-            "Sandra Hill",
-            "Brian Scott",
-            "Carol Green",
-            "Jason Adams",
-            "Laura Baker",
-            "Steven Nelson",
-            "Dorothy Carter",
-        ]
+        # Build plain row dicts first and write each table with batched multi-row
+        # INSERTs; movie-relative rows refer to their movie by position until the
+        # movie ids come back from the database.
+        movie_rows: list[dict] = []
+        genre_rows: list[tuple[int, Genre]] = []
+        credit_rows: list[tuple[int, str, MovieRole]] = []
+        review_rows: list[tuple[int, dict]] = []
+
+        # Draw every row's image and review count up front instead of calling the RNG
+        # per row.
+        image_paths = (
+            random.choices(available_images, k=len(rows))
+            if available_images
+            else [None] * len(rows)
+        )
+        review_counts = random.choices(range(2, 6), k=len(rows))
 
         for idx, row in enumerate(rows):
             if not isinstance(row, dict):
@@ -211,8 +325,7 @@ def run_seed(data_path: Path | None = None) -> bool:
                 continue
 
             release_date = _parse_date(row.get("ReleaseDate"))
-            # Randomly assign an image if available
-            image_path = random.choice(available_images) if available_images else None
+            image_path = image_paths[idx]
 
             # Get rating from ratings.json if available
             movie_rating = None
@@ -221,40 +334,33 @@ def run_seed(data_path: Path | None = None) -> bool:
                 if rating_value is not None:
                     movie_rating = float(rating_value)
 
-            movie = Movie(
-                title=title,
-                description=(row.get("Description") or "").strip() or None,
-                release_date=release_date,
-                image_path=image_path,
-                rating=movie_rating,
+            pos = len(movie_rows)
+            movie_rows.append(
+                {
+                    "title": title,
+                    "description": (row.get("Description") or "").strip() or None,
+                    "release_date": release_date,
+                    "image_path": image_path,
+                    "rating": movie_rating,
+                    "rating_sum": 0.0,
+                    "rating_count": 0,
+                }
             )
-            db.add(movie)
-            db.flush()
 
             genre_raw = row.get("Genre")
             if genre_raw:
-                g = _parse_genre(genre_raw)
-                db.add(MovieGenre(movie_id=movie.id, genre=g))
-
-            actor_name = (row.get("Actor") or "").strip()
-            if actor_name:
-                person = _get_or_create_person(db, actor_name)
-                db.add(MoviePerson(movie_id=movie.id, person_id=person.id, role=MovieRole.Actor))
+                genre_rows.append((pos, _parse_genre(genre_raw)))
 
-            director_name = (row.get("Director") or "").strip()
-            if director_name:
-                person = _get_or_create_person(db, director_name)
-                db.add(MoviePerson(movie_id=movie.id, person_id=person.id, role=MovieRole.Director))
-
-            producer_name = (row.get("Producer") or "").strip()
-            if producer_name:
-                person = _get_or_create_person(db, producer_name)
-                db.add(MoviePerson(movie_id=movie.id, person_id=person.id, role=MovieRole.Producer))
+            for key, role in CREDIT_ROLES:
+                name = (row.get(key) or "").strip()
+                if name:
+                    credit_rows.append((pos, name, role))
 
             # Add reviews for this movie (2-5 random reviews)
             if reviews_data:
-                num_reviews = random.randint(2, 5)
-                selected_reviews = random.sample(reviews_data, min(num_reviews, len(reviews_data)))
+                selected_reviews = random.sample(
+                    reviews_data, min(review_counts[idx], len(reviews_data))
+                )
 
                 for review_text in selected_reviews:
                     if not review_text or not isinstance(review_text, str):
@@ -262,20 +368,42 @@ def run_seed(data_path: Path | None = None) -> bool:
 
                     # Random rating between 5.0 and 10.0 for each review
                     review_rating = round(random.uniform(5.0, 10.0), 1)
-                    reviewer_name = random.choice(reviewer_names)
-
-                    review = Review(
-                        movie_id=movie.id,
-                        author_name=reviewer_name,
-                        rating=review_rating,
-                        content=review_text.strip(),
+                    review_rows.append(
+                        (
+                            pos,
+                            {
+                                "author_name": random.choice(REVIEWER_NAMES),
+                                "rating": review_rating,
+                                "content": review_text.strip(),
+                            },
+                        )
                     )
-                    db.add(review)
+                    movie_rows[pos]["rating_sum"] += review_rating
+                    movie_rows[pos]["rating_count"] += 1
+
+        movie_ids = _insert_returning_ids(db, Movie, movie_rows)
+        person_ids = _resolve_persons(db, list(dict.fromkeys(name for _, name, _ in credit_rows)))
+
+        _insert_all(
+            db,
+            MovieGenre,
+            [{"movie_id": movie_ids[pos], "genre": genre} for pos, genre in genre_rows],
+        )
+        _insert_all(
+            db,
+            MoviePerson,
+            [
+                {"movie_id": movie_ids[pos], "person_id": person_ids[name], "role": role}
+                for pos, name, role in credit_rows
+            ],
+        )
+        _insert_all(
+            db,
+            Review,
+            [{"movie_id": movie_ids[pos], **review} for pos, review in review_rows],
+        )
 
-        db.commit()
         return True
-    finally:
-        db.close()
 
 
 def main() -> None:
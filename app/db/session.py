@@ -1,21 +1,28 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator
 
 from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
 
-from app.db.config import database_url
+from app.db.config import database_url, engine_options
 
-engine = create_engine(
-    database_url(),
-    pool_pre_ping=True,
-)
+# psycopg2 engine for the seed and the admin reset, which run outside the event loop.
+# Requests are served by the async engine below, so this one gets a small fixed pool
+# rather than the request-sized DB_POOL_SIZE, which would only reserve idle connections.
+engine = create_engine(database_url(), **{**engine_options(), "pool_size": 2, "max_overflow": 0})
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Keep loaded attributes after commit so callers can use ORM objects
+# without an extra SELECT to re-populate them.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 
-def get_db() -> Generator[Session, None, None]:
-    db = SessionLocal()
-    try:
+# asyncpg engine for `async def` handlers, which run on the event loop instead of
+# taking a threadpool slot. All routers use it, so it gets the DB_POOL_* settings.
+async_engine = create_async_engine(database_url("asyncpg"), **engine_options())
+
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -1,8 +1,11 @@
 """Configure application logging to file and console."""
 
+import atexit
 import logging
 import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 # Directory for log files (default: /app/data/logs in container, cwd when not set)
 LOG_DIR = os.environ.get("LOG_DIR", "/app/data/logs")
@@ -17,10 +20,16 @@ DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
 def setup_logging() -> None:
-    """Configure root logger to write to a file and to stdout."""
+    """
+    Configure root logger to write to a file and to stdout. Records are queued and
+    written by a background thread, so logging never blocks a request on disk I/O.
+    """
     os.makedirs(LOG_DIR, exist_ok=True)
 
-    from logging.handlers import RotatingFileHandler
+    # LOG_FORMAT shows no thread or process fields, so don't collect them per record.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
 
     root = logging.getLogger()
     root.setLevel(LOG_LEVEL)
@@ -33,11 +42,16 @@ def setup_logging() -> None:
         encoding="utf-8",
     )
     file_handler.setFormatter(formatter)
-    root.addHandler(file_handler)
 
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    root.addHandler(console_handler)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    # Flush what is still queued on interpreter exit.
+    atexit.register(listener.stop)
 
     # Reduce noise from third-party loggers
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
@@ -5,17 +5,20 @@ from pathlib import Path
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.api.routers import admin, movies, persons
 from app.db.seed import run_seed
+from app.db.session import async_engine
 from app.logging_config import setup_logging
 
 setup_logging()
 logger = logging.getLogger(__name__)
 
+# orjson serializes the validated response dicts several times faster than json.dumps.
 app = FastAPI(
+    default_response_class=ORJSONResponse,
     title="IMDB API",
     version="0.1.0",
     description="REST API for movies and persons with roles (Actor, Director, Producer). "
@@ -103,6 +106,11 @@ def on_startup() -> None:
         logger.warning("Auto-seed failed: %s", e)
 
 
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    await async_engine.dispose()
+
+
 @app.get("/health", tags=["health"])
 def health() -> dict:
     """Liveness check. Returns 200 when the API is up."""
@@ -0,0 +1,70 @@
+"""Request body examples for the OpenAPI docs, attached with Body(openapi_examples=...)."""
+
+MOVIE_CREATE_EXAMPLES = {
+    "full": {
+        "summary": "All fields",
+        "value": {
+            "title": "Inception",
+            "description": "A thief who steals corporate secrets through dream-sharing.",
+            "release_date": "2010-07-16",
+            "genres": [5, 6],
+            "rating": 8.8,
+        },
+    },
+    "minimal": {
+        "summary": "Required fields only",
+        "value": {"title": "Minimal Movie", "genres": [2]},
+    },
+}
+
+MOVIE_BULK_CREATE_EXAMPLES = {
+    "two_movies": {
+        "summary": "Two movies",
+        "value": {
+            "movies": [
+                {"title": "Movie One", "genres": [1]},
+                {"title": "Movie Two", "genres": [2], "rating": 7.5},
+            ]
+        },
+    },
+}
+
+MOVIE_UPDATE_EXAMPLES = {
+    "title_and_rating": {
+        "summary": "Change title and rating",
+        "value": {"title": "Updated Title", "rating": 9.0},
+    },
+}
+
+ADD_PERSONS_TO_MOVIE_EXAMPLES = {
+    "actor": {
+        "summary": "Add one actor",
+        "value": [{"person_id": 1, "role": "Actor"}],
+    },
+}
+
+PERSON_CREATE_EXAMPLES = {
+    "person": {
+        "summary": "New person",
+        "value": {"name": "Jane Doe", "email": "jane.doe@example.com"},
+    },
+}
+
+PERSON_UPDATE_EXAMPLES = {
+    "name": {
+        "summary": "Change name",
+        "value": {"name": "Updated Name"},
+    },
+}
+
+REVIEW_CREATE_EXAMPLES = {
+    "review": {
+        "summary": "New review",
+        "value": {
+            "author_name": "John Doe",
+            "rating": 8.5,
+            "content": "Great movie! The acting was superb and the story kept me engaged "
+            "throughout.",
+        },
+    },
+}
@@ -1,51 +1,33 @@
 from datetime import date, datetime
+from typing import Annotated, Required
 
 from pydantic import BaseModel, ConfigDict, Field
+from typing_extensions import TypedDict  # pydantic rejects typing.TypedDict before 3.12
 
 from app.db.models.genre import Genre
 
 BULK_UPLOAD_LIMIT = 300
 
 
-class MovieCreate(BaseModel):
-    title: str
-    description: str | None = None
-    release_date: date | None = None
-    genres: list[Genre] = Field(..., min_length=1, description="At least one genre required.")
-    rating: float | None = None
+class MovieCreate(TypedDict, total=False):
+    """
+    A new movie; the body of POST /movies and each item of a bulk upload. A TypedDict
+    rather than a model: pydantic validates it straight into a dict, skipping a model
+    instance per movie in a bulk upload.
+    """
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "examples": [
-                {
-                    "title": "Inception",
-                    "description": "A thief who steals corporate secrets through dream-sharing.",
-                    "release_date": "2010-07-16",
-                    "genres": [5, 6],
-                    "rating": 8.8,
-                },
-                {"title": "Minimal Movie", "genres": [2]},
-            ]
-        }
-    )
+    title: Required[str]
+    description: str | None
+    release_date: date | None
+    genres: Required[
+        Annotated[list[Genre], Field(min_length=1, description="At least one genre required.")]
+    ]
+    rating: float | None
 
 
 class MovieBulkCreate(BaseModel):
     movies: list[MovieCreate] = Field(max_length=BULK_UPLOAD_LIMIT)
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "examples": [
-                {
-                    "movies": [
-                        {"title": "Movie One", "genres": [1]},
-                        {"title": "Movie Two", "genres": [2], "rating": 7.5},
-                    ]
-                }
-            ]
-        }
-    )
-
 
 class MovieUpdate(BaseModel):
     title: str | None = None
@@ -55,19 +37,15 @@ class MovieUpdate(BaseModel):
     rating: float | None = None
     image_path: str | None = None
 
-    model_config = ConfigDict(
-        json_schema_extra={"examples": [{"title": "Updated Title", "rating": 9.0}]}
-    )
-
 
 class MovieResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: int
     title: str
     description: str | None
     release_date: date | None
-    genres: list[Genre]
+    genres: tuple[Genre, ...]
     rating: float | None
     image_path: str | None
     created_at: datetime
@@ -76,7 +54,7 @@ class MovieResponse(BaseModel):
 
 class MovieListResponse(BaseModel):
     items: list[MovieResponse]
-    total: int
+    total: int | None = Field(description="Number of matching movies; null if include_total=false.")
     skip: int
     limit: int
 
@@ -92,3 +70,13 @@ class MovieSearchRequest(BaseModel):
     actor_ids: list[int] | None = None  # OR: movies that feature any of these actors
     skip: int = Field(0, ge=0, description="Number of records to skip (for paging).")
     limit: int = Field(20, ge=1, le=100, description="Maximum number of records to return (1–100).")
+    after_id: int | None = Field(
+        None,
+        description="Keyset paging: only movies with id greater than this (the last item's id "
+        "from the previous page). Takes precedence over skip.",
+    )
+    include_total: bool = Field(
+        True,
+        description="Count all matches into `total`. Set false (total is null) when paging "
+        "with after_id and stopping at a short page, e.g. for infinite scroll.",
+    )
@@ -1,4 +1,6 @@
-from pydantic import BaseModel, ConfigDict
+from datetime import date
+
+from pydantic import AliasPath, BaseModel, ConfigDict, Field
 
 from app.db.models.role import MovieRole
 
@@ -7,11 +9,9 @@ class AddPersonToMovieRequest(BaseModel):
     person_id: int
     role: MovieRole
 
-    model_config = ConfigDict(json_schema_extra={"examples": [{"person_id": 1, "role": "Actor"}]})
-
 
 class MoviePersonResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: int
     movie_id: int
@@ -22,19 +22,20 @@ class MoviePersonResponse(BaseModel):
 class PersonInMovieResponse(BaseModel):
     """Response model that includes person details along with the relationship."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: int  # movie_person id
     person_id: int
-    person_name: str
-    person_email: str
+    # Read from the MoviePerson's loaded `person`; serialized under these flat names.
+    person_name: str = Field(validation_alias=AliasPath("person", "name"))
+    person_email: str = Field(validation_alias=AliasPath("person", "email"))
     role: MovieRole
 
 
 class MovieInPersonResponse(BaseModel):
     """Response model that includes movie details along with the relationship."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: int  # movie_person id
     movie_id: int
@@ -42,5 +43,5 @@ class MovieInPersonResponse(BaseModel):
     role: MovieRole
     image_path: str | None = None
     rating: float | None = None
-    release_date: str | None = None
+    release_date: date | None = None
     genres: list[int] = []
@@ -10,20 +10,14 @@ class PersonCreate(BaseModel):
     name: str
     email: str
 
-    model_config = ConfigDict(
-        json_schema_extra={"examples": [{"name": "Jane Doe", "email": "jane.doe@example.com"}]}
-    )
-
 
 class PersonUpdate(BaseModel):
     name: str | None = None
     email: str | None = None
 
-    model_config = ConfigDict(json_schema_extra={"examples": [{"name": "Updated Name"}]})
-
 
 class PersonResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: int
     name: str
@@ -35,7 +29,9 @@ class PersonResponse(BaseModel):
 
 class PersonListResponse(BaseModel):
     items: list[PersonResponse]
-    total: int
+    total: int | None = Field(
+        description="Number of matching persons; null if include_total=false."
+    )
     skip: int
     limit: int
 
@@ -51,3 +47,6 @@ class PersonSearchRequest(BaseModel):
     roles: list[MovieRole] | None = None  # OR: persons who have any of these roles
     skip: int = Field(0, ge=0, description="Number of records to skip (for paging).")
     limit: int = Field(20, ge=1, le=100, description="Maximum number of records to return (1–100).")
+    include_total: bool = Field(
+        True, description="Count all matches into `total`. Set false (total is null) to skip it."
+    )
@@ -10,23 +10,11 @@ class ReviewCreate(BaseModel):
     rating: float = Field(..., ge=0, le=10, description="Rating from 0-10")
     content: str = Field(..., min_length=1, description="Review content")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "examples": [
-                {
-                    "author_name": "John Doe",
-                    "rating": 8.5,
-                    "content": "Great movie! The acting was superb and the story kept me engaged throughout.",
-                }
-            ]
-        }
-    )
-
 
 class ReviewResponse(BaseModel):
     """Schema for review response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: int
     movie_id: int
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import functools
 import os
 
 from app.storage.base import StorageBackend
 from app.storage.local import LocalFileSystemStorage
 
+# Read once at import; the environment does not change while the app runs.
+_BACKEND_TYPE = os.getenv("STORAGE_BACKEND", "local").lower()
+_LOCAL_PATH = os.getenv("STORAGE_LOCAL_PATH", "./uploads")
+_LOCAL_URL = os.getenv("STORAGE_LOCAL_URL", "/static/uploads")
+
 
 def get_storage_backend() -> StorageBackend:
     """
@@ -17,12 +23,8 @@ def get_storage_backend() -> StorageBackend:
     - "s3": Amazon S3 storage (future implementation)
     - "gcs": Google Cloud Storage (future implementation)
     """
-    backend_type = os.getenv("STORAGE_BACKEND", "local").lower()
-
-    if backend_type == "local":
-        storage_path = os.getenv("STORAGE_LOCAL_PATH", "./uploads")
-        storage_url = os.getenv("STORAGE_LOCAL_URL", "/static/uploads")
-        return LocalFileSystemStorage(base_path=storage_path, base_url=storage_url)
+    if _BACKEND_TYPE == "local":
+        return LocalFileSystemStorage(base_path=_LOCAL_PATH, base_url=_LOCAL_URL)
 
     # Future implementations:
     # elif backend_type == "s3":
@@ -38,16 +40,10 @@ def get_storage_backend() -> StorageBackend:
     #         credentials=os.getenv("GCS_CREDENTIALS_PATH"),
     #     )
 
-    raise ValueError(f"Unsupported storage backend: {backend_type}")
-
-
-# Singleton instance
-_storage_backend: StorageBackend | None = None
+    raise ValueError(f"Unsupported storage backend: {_BACKEND_TYPE}")
 
 
+@functools.cache
 def get_storage() -> StorageBackend:
     """Get the storage backend singleton."""
-    global _storage_backend
-    if _storage_backend is None:
-        _storage_backend = get_storage_backend()
-    return _storage_backend
+    return get_storage_backend()
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-import uuid
+import os
+import secrets
+import shutil
 from pathlib import Path
 from typing import BinaryIO
 
+from starlette.concurrency import run_in_threadpool
+
 from app.storage.base import StorageBackend
 
+CHUNK_SIZE = 1 << 20  # 1 MiB per read/write when copying an upload to disk
+
 
 class LocalFileSystemStorage(StorageBackend):
     """Store files on local filesystem."""
@@ -34,18 +40,23 @@ class LocalFileSystemStorage(StorageBackend):
             Relative path from base_path
         """
         # Generate unique filename while preserving extension
-        ext = Path(filename).suffix
-        unique_filename = f"{uuid.uuid4()}{ext}"
+        ext = os.path.splitext(filename)[1]
+        unique_filename = f"{secrets.token_hex(16)}{ext}"
 
         file_path = self.base_path / unique_filename
 
-        # Write file in chunks
-        with open(file_path, "wb") as f:
-            while chunk := file.read(8192):
-                f.write(chunk)
+        # Blocking file I/O: run it in the threadpool so the event loop keeps serving
+        # other requests while a large upload is written.
+        await run_in_threadpool(self._write, file, file_path)
 
         return unique_filename
 
+    @staticmethod
+    def _write(file: BinaryIO, file_path: Path) -> None:
+        """Copy `file` to `file_path` in chunks."""
+        with open(file_path, "wb") as f:
+            shutil.copyfileobj(file, f, CHUNK_SIZE)
+
     async def delete(self, path: str) -> bool:
         """Delete file from local filesystem."""
         try:
@@ -1,5 +1,7 @@
 """Integration tests for Admin API (run against live API in Docker)."""
 
+import time
+
 import httpx
 
 
@@ -80,3 +82,43 @@ class TestAdminDbReset:
         assert list_resp.status_code == 200
         assert list_resp.json()["total"] >= 1
         assert len(list_resp.json()["items"]) >= 1
+
+    def test_background_reset_returns_202_and_job_completes(self, base_url: str) -> None:
+        """POST /admin/db/reset?background=true returns 202 with a job that reaches done."""
+        with httpx.Client(timeout=10.0) as client:
+            response = client.post(f"{base_url}/admin/db/reset", params={"background": "true"})
+            assert response.status_code == 202
+            job = response.json()
+            assert job["action"] == "reset"
+            assert job["status"] in ("pending", "running", "done")
+
+            for _ in range(50):
+                job = client.get(f"{base_url}/admin/db/job/{job['id']}").json()
+                if job["status"] in ("done", "failed"):
+                    break
+                time.sleep(0.2)
+            list_resp = client.get(f"{base_url}/movies?limit=5")
+
+        assert job["status"] == "done"
+        assert job["result"]["status"] == "ok"
+        assert list_resp.json()["total"] >= 1
+
+    def test_unknown_job_returns_404(self, base_url: str) -> None:
+        """GET /admin/db/job/{id} for an unknown id returns 404."""
+        with httpx.Client(timeout=10.0) as client:
+            response = client.get(f"{base_url}/admin/db/job/does-not-exist")
+        assert response.status_code == 404
+
+
+class TestAdminStats:
+    def test_stats_returns_movie_and_person_totals(self, base_url: str) -> None:
+        """GET /admin/stats returns total movies and persons matching the list endpoints."""
+        with httpx.Client(timeout=10.0) as client:
+            response = client.get(f"{base_url}/admin/stats")
+            movies_total = client.get(f"{base_url}/movies?limit=1").json()["total"]
+            persons_total = client.get(f"{base_url}/persons?limit=1").json()["total"]
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_movies"] == movies_total
+        assert data["total_professionals"] == persons_total
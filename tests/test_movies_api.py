@@ -144,6 +144,20 @@ class TestMoviesApi:
         assert data["rating"] == 9.0
         assert "image_path" in data
 
+    def test_get_movie_after_update_returns_updated_body(self, base_url: str) -> None:
+        """GET /movies/{id} reflects a PATCH made after an earlier GET of the same movie."""
+        with httpx.Client(timeout=10.0) as client:
+            movie_id = client.post(
+                f"{base_url}/movies", json={"title": "Before Update", "genres": [1]}
+            ).json()["id"]
+            before = client.get(f"{base_url}/movies/{movie_id}")
+            client.patch(f"{base_url}/movies/{movie_id}", json={"title": "After Update"})
+            after = client.get(f"{base_url}/movies/{movie_id}")
+
+        assert before.json()["title"] == "Before Update"
+        assert after.status_code == 200
+        assert after.json()["title"] == "After Update"
+
     def test_update_movie_with_multiple_genres_replaces_genres(self, base_url: str) -> None:
         """PATCH /movies/{id} with genres replaces existing genres with the new list."""
         with httpx.Client(timeout=10.0) as client:
@@ -268,6 +282,34 @@ class TestMoviesApi:
             assert "genres" in item
             assert "image_path" in item
 
+    def test_list_movies_after_id_returns_next_page(self, base_url: str) -> None:
+        """GET /movies?after_id=N returns movies with id > N in id order, with the full total."""
+        with httpx.Client(timeout=10.0) as client:
+            client.post(
+                f"{base_url}/movies/bulk",
+                json={"movies": [{"title": f"Keyset {i}", "genres": [1]} for i in range(3)]},
+            )
+            first = client.get(f"{base_url}/movies?limit=2").json()
+            response = client.get(f"{base_url}/movies?limit=2&after_id={first['items'][-1]['id']}")
+
+        assert response.status_code == 200
+        data = response.json()
+        ids = [item["id"] for item in data["items"]]
+        assert ids == sorted(ids)
+        assert all(i > first["items"][-1]["id"] for i in ids)
+        assert data["total"] == first["total"]
+
+    def test_list_movies_include_total_false_returns_null_total(self, base_url: str) -> None:
+        """GET /movies?include_total=false returns the same page with total null."""
+        with httpx.Client(timeout=10.0) as client:
+            counted = client.get(f"{base_url}/movies?limit=3").json()
+            response = client.get(f"{base_url}/movies?limit=3&include_total=false")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] is None
+        assert [m["id"] for m in data["items"]] == [m["id"] for m in counted["items"]]
+
     def test_add_person_to_movie_returns_201_and_body(self, base_url: str) -> None:
         """POST /movies/{id}/persons adds a person in a role and returns 201."""
         with httpx.Client(timeout=10.0) as client:
@@ -455,6 +497,29 @@ class TestMoviesApi:
         assert r2.status_code == 409
         assert "director" in r2.json().get("detail", "").lower()
 
+    def test_add_person_to_movie_same_director_again_returns_duplicate_409(
+        self, base_url: str
+    ) -> None:
+        """Re-adding the movie's director reports a duplicate credit, not a second director."""
+        with httpx.Client(timeout=10.0) as client:
+            director = client.post(
+                f"{base_url}/persons",
+                json={"name": "Director Again", "email": _unique_email("dirAgain")},
+            )
+            assert director.status_code == 201
+            movie_resp = client.post(
+                f"{base_url}/movies",
+                json={"title": "Same Director Twice", "genres": [1]},
+            )
+            assert movie_resp.status_code == 201
+            movie_id = movie_resp.json()["id"]
+            credit = [{"person_id": director.json()["id"], "role": "Director"}]
+            r1 = client.post(f"{base_url}/movies/{movie_id}/persons", json=credit)
+            r2 = client.post(f"{base_url}/movies/{movie_id}/persons", json=credit)
+        assert r1.status_code == 201
+        assert r2.status_code == 409
+        assert "already assigned" in r2.json().get("detail", "")
+
     def test_add_person_to_movie_two_directors_in_same_request_returns_409(
         self, base_url: str
     ) -> None:
@@ -867,6 +932,47 @@ class TestMoviesApi:
         assert mid1 in ids
         assert mid2 in ids
 
+    def test_search_movies_by_director_and_actors_returns_intersection(self, base_url: str) -> None:
+        """POST /movies/search with director_id and actor_ids returns movies matching both."""
+        with httpx.Client(timeout=10.0) as client:
+            d = client.post(
+                f"{base_url}/persons",
+                json={"name": "Director Both", "email": _unique_email("dir-both")},
+            )
+            a = client.post(
+                f"{base_url}/persons",
+                json={"name": "Actor Both", "email": _unique_email("actor-both")},
+            )
+            assert d.status_code == 201
+            assert a.status_code == 201
+            director_id, actor_id = d.json()["id"], a.json()["id"]
+            both = client.post(f"{base_url}/movies", json={"title": "Both", "genres": [1]})
+            directed = client.post(
+                f"{base_url}/movies", json={"title": "Director only", "genres": [1]}
+            )
+            assert both.status_code == 201
+            assert directed.status_code == 201
+            both_id, directed_id = both.json()["id"], directed.json()["id"]
+            client.post(
+                f"{base_url}/movies/{both_id}/persons",
+                json=[
+                    {"person_id": director_id, "role": "Director"},
+                    {"person_id": actor_id, "role": "Actor"},
+                ],
+            )
+            client.post(
+                f"{base_url}/movies/{directed_id}/persons",
+                json=[{"person_id": director_id, "role": "Director"}],
+            )
+            response = client.post(
+                f"{base_url}/movies/search",
+                json={"director_id": director_id, "actor_ids": [actor_id], "skip": 0, "limit": 20},
+            )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        assert [m["id"] for m in data["items"]] == [both_id]
+
     def test_search_movies_paging_respected(self, base_url: str) -> None:
         """POST /movies/search with skip/limit returns correct page."""
         with httpx.Client(timeout=10.0) as client:
@@ -897,6 +1003,22 @@ class TestMoviesApi:
         assert r1.json()["limit"] == 2
         assert r2.json()["limit"] == 2
 
+    def test_search_movies_after_id_continues_from_last_item(self, base_url: str) -> None:
+        """POST /movies/search with after_id continues after the previous page's last id."""
+        title = f"Seek {uuid.uuid4().hex[:8]}"
+        with httpx.Client(timeout=10.0) as client:
+            for i in range(3):
+                client.post(f"{base_url}/movies", json={"title": f"{title} {i}", "genres": [2]})
+            r1 = client.post(f"{base_url}/movies/search", json={"title": title, "limit": 2})
+            r2 = client.post(
+                f"{base_url}/movies/search",
+                json={"title": title, "limit": 2, "after_id": r1.json()["items"][-1]["id"]},
+            )
+        assert r2.status_code == 200
+        assert [m["title"] for m in r1.json()["items"]] == [f"{title} 0", f"{title} 1"]
+        assert [m["title"] for m in r2.json()["items"]] == [f"{title} 2"]
+        assert r2.json()["total"] == 3
+
     def test_search_movies_by_title_returns_matching_movies(self, base_url: str) -> None:
         """POST /movies/search with title filters by substring match on title (case-insensitive)."""
         with httpx.Client(timeout=10.0) as client:
@@ -494,6 +494,48 @@ class TestPersonsApi:
         assert r1.json()["total"] == r2.json()["total"]
         assert r1.json()["total"] >= 4
 
+    def test_search_persons_include_total_false_returns_null_total(self, base_url: str) -> None:
+        """POST /persons/search with include_total false returns the page with total null."""
+        with httpx.Client(timeout=10.0) as client:
+            client.post(
+                f"{base_url}/persons",
+                json={"name": "NoTotal Person", "email": _unique_email("nototal")},
+            )
+            response = client.post(
+                f"{base_url}/persons/search",
+                json={"search": "NoTotal Person", "include_total": False},
+            )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] is None
+        assert "NoTotal Person" in [p["name"] for p in data["items"]]
+        assert all(p["movie_count"] == 0 for p in data["items"])
+
+    def test_search_persons_if_none_match_returns_304_until_results_change(
+        self, base_url: str
+    ) -> None:
+        """POST /persons/search returns an ETag; sending it back gives 304 until a write."""
+        name = f"ETag Person {uuid.uuid4().hex[:8]}"
+        body = {"search": name}
+        with httpx.Client(timeout=10.0) as client:
+            client.post(f"{base_url}/persons", json={"name": name, "email": _unique_email("etag")})
+            first = client.post(f"{base_url}/persons/search", json=body)
+            etag = first.headers["etag"]
+            unchanged = client.post(
+                f"{base_url}/persons/search", json=body, headers={"If-None-Match": etag}
+            )
+            client.post(f"{base_url}/persons", json={"name": name, "email": _unique_email("etag2")})
+            changed = client.post(
+                f"{base_url}/persons/search", json=body, headers={"If-None-Match": etag}
+            )
+        assert first.status_code == 200
+        assert first.json()["total"] == 1
+        assert unchanged.status_code == 304
+        assert unchanged.headers["etag"] == etag
+        assert changed.status_code == 200
+        assert changed.json()["total"] == 2
+        assert changed.headers["etag"] != etag
+
     def test_search_persons_by_search_combined_with_movie_ids(self, base_url: str) -> None:
         """POST /persons/search with search and movie_ids applies both filters."""
         with httpx.Client(timeout=10.0) as client:
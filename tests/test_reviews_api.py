@@ -1,5 +1,7 @@
 """Integration tests for Movie Reviews API (run against live API in Docker)."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import httpx
 import pytest
 
@@ -332,6 +334,86 @@ class TestMovieReviewsApi:
             expected_avg = (8.0 + 6.0 + 10.0) / 3
             assert reviews3.json()["average_rating"] == pytest.approx(expected_avg, rel=0.1)
 
+    def test_average_rating_updates_after_deleting_review(self, base_url: str) -> None:
+        """Total and average rating drop the deleted review."""
+        with httpx.Client(timeout=10.0) as client:
+            movie_resp = client.post(
+                f"{base_url}/movies",
+                json={"title": "Movie Rating Delete Test", "genres": [4]},
+            )
+            movie_id = movie_resp.json()["id"]
+
+            first = client.post(
+                f"{base_url}/movies/{movie_id}/reviews",
+                json={"author_name": "User1", "rating": 9.0, "content": "Great"},
+            )
+            client.post(
+                f"{base_url}/movies/{movie_id}/reviews",
+                json={"author_name": "User2", "rating": 5.0, "content": "Meh"},
+            )
+            client.delete(f"{base_url}/movies/{movie_id}/reviews/{first.json()['id']}")
+
+            data = client.get(f"{base_url}/movies/{movie_id}/reviews").json()
+            assert data["total"] == 1
+            assert data["average_rating"] == 5.0
+
+            second_id = data["items"][0]["id"]
+            client.delete(f"{base_url}/movies/{movie_id}/reviews/{second_id}")
+            data = client.get(f"{base_url}/movies/{movie_id}/reviews").json()
+            assert data["total"] == 0
+            assert data["average_rating"] is None
+
+    def test_deleting_same_review_twice_drops_totals_once(self, base_url: str) -> None:
+        """Concurrent deletes of one review: one 204, one 404, totals drop once."""
+        with httpx.Client(timeout=10.0) as client:
+            movie_resp = client.post(
+                f"{base_url}/movies",
+                json={"title": "Movie Double Delete Test", "genres": [1]},
+            )
+            movie_id = movie_resp.json()["id"]
+            first = client.post(
+                f"{base_url}/movies/{movie_id}/reviews",
+                json={"author_name": "User1", "rating": 9.0, "content": "Great"},
+            )
+            client.post(
+                f"{base_url}/movies/{movie_id}/reviews",
+                json={"author_name": "User2", "rating": 5.0, "content": "Meh"},
+            )
+            url = f"{base_url}/movies/{movie_id}/reviews/{first.json()['id']}"
+
+            def delete_review(_: int) -> int:
+                with httpx.Client(timeout=10.0) as own_client:
+                    return own_client.delete(url).status_code
+
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                statuses = sorted(pool.map(delete_review, range(2)))
+            assert statuses == [204, 404]
+            assert client.delete(url).status_code == 404
+
+            data = client.get(f"{base_url}/movies/{movie_id}/reviews").json()
+            assert data["total"] == 1
+            assert data["average_rating"] == 5.0
+
+    def test_adding_and_deleting_reviews_leaves_movie_updated_at(self, base_url: str) -> None:
+        """Reviews update the movie's rating totals but not its updated_at."""
+        with httpx.Client(timeout=10.0) as client:
+            movie_resp = client.post(
+                f"{base_url}/movies",
+                json={"title": "Movie Updated At Review Test", "genres": [2]},
+            )
+            movie_id = movie_resp.json()["id"]
+            updated_at = movie_resp.json()["updated_at"]
+
+            review_resp = client.post(
+                f"{base_url}/movies/{movie_id}/reviews",
+                json={"author_name": "User1", "rating": 8.0, "content": "Good"},
+            )
+            assert review_resp.status_code == 201
+            assert client.get(f"{base_url}/movies/{movie_id}").json()["updated_at"] == updated_at
+
+            client.delete(f"{base_url}/movies/{movie_id}/reviews/{review_resp.json()['id']}")
+            assert client.get(f"{base_url}/movies/{movie_id}").json()["updated_at"] == updated_at
+
     def test_deleting_movie_cascades_to_reviews(self, base_url: str) -> None:
         """Deleting a movie should cascade delete all its reviews."""
         with httpx.Client(timeout=10.0) as client: